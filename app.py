@@ -1,9 +1,14 @@
+import io
+import uuid
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from model_pso import PSOOptimizer
 from fts_manual import FTSLeeManual
+from data_loader import load_kurs_csv, data_fingerprint
+from result_cache import ResultCache, make_key
+from jobs import JobManager
+from rendering import render_line_chart, page_count
 
 st.set_page_config(
     page_title="Prediksi Nilai Tukar Rupiah",
@@ -11,12 +16,153 @@ st.set_page_config(
     layout="wide",
 )
 
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def parse_upload(file_bytes):
+    # Di-cache menurut isi file, jadi rerun dengan file yang sama tidak mem-parse ulang
+    data, stats = load_kurs_csv(io.BytesIO(file_bytes))
+    return data, stats, data_fingerprint(data)
+
+
+@st.cache_resource
+def get_result_cache():
+    # Satu cache untuk semua sesi di server ini
+    return ResultCache(max_entries=32)
+
+
+@st.cache_resource
+def get_job_manager():
+    # Pool job optimasi bersama untuk semua sesi; script Streamlit tidak menunggu perhitungan
+    return JobManager(max_workers=2, max_active_per_owner=1)
+
+
+@st.cache_resource
+def get_figure_cache():
+    # PNG grafik per (id hasil, nama grafik); rerun dengan hasil yang sama tidak menggambar ulang
+    return ResultCache(max_entries=64)
+
+
+def current_params():
+    return {
+        "n_particles": int(st.session_state.n_particles),
+        "n_iterations": int(st.session_state.n_iterations),
+        "w": float(st.session_state.w),
+        "c1": float(st.session_state.c1),
+        "c2": float(st.session_state.c2),
+        "seed": int(st.session_state.seed),
+    }
+
+
+def paginated_table(tanggal, aktual, prediksi, key, page_size=50):
+    # Hanya satu halaman yang diformat dan dikirim ke browser, berapa pun panjang datanya
+    n_pages = page_count(len(aktual), page_size)
+    page = st.number_input(f"Halaman (1-{n_pages})", min_value=1, max_value=n_pages, value=1, key=key)
+    start = (int(page) - 1) * page_size
+    end = min(start + page_size, len(aktual))
+    st.dataframe(pd.DataFrame({
+        "No": range(start + 1, end + 1),
+        "Tanggal": tanggal.iloc[start:end].dt.strftime('%d-%m-%Y').values,
+        "Aktual": aktual[start:end],
+        "Prediksi": prediksi[start:end],
+    }, index=range(start, end)))
+
+
+def session_owner():
+    # Disimpan di URL agar job tetap bisa ditemukan setelah browser di-refresh
+    if "sesi" not in st.query_params:
+        st.query_params["sesi"] = uuid.uuid4().hex[:12]
+    return st.query_params["sesi"]
+
+
+def show_results(results, params):
+    st.session_state.update(params)
+    st.session_state.update(results)
+    st.session_state.page = "output"
+
+
+@st.fragment(run_every=1.0)
+def job_panel(job_id):
+    manager = get_job_manager()
+    job = manager.get(job_id)
+    if job is None:
+        st.warning("⚠️ Job tidak ditemukan (mungkin server telah dimulai ulang).")
+        return
+
+    selesai = len(job.progress)
+    st.markdown(f"**Job `{job.id}`** — status: **{job.status}**")
+    st.progress(min(selesai / max(job.n_iterations, 1), 1.0), text=f"Iterasi {selesai}/{job.n_iterations}")
+    if job.progress:
+        st.line_chart(pd.DataFrame({"MAPE gbest (%)": job.progress}, index=range(1, selesai + 1)))
+
+    if job.active:
+        if st.button("⛔ Batalkan", key=f"batal_{job.id}"):
+            manager.cancel(job.id)
+    elif job.status == "selesai":
+        show_results(job.result, job.params)
+        st.rerun(scope="app")
+    elif job.status == "gagal":
+        st.error(f"❌ Perhitungan gagal: {job.error}")
+    else:
+        st.info("Job dibatalkan.")
+
+
+def compute_results(data, params, callbacks=None):
+    fts_manual = FTSLeeManual(data)
+    optimizer = PSOOptimizer(
+        data,
+        params["n_particles"],
+        params["n_iterations"],
+        w=params["w"],
+        c1=params["c1"],
+        c2=params["c2"],
+        seed=params["seed"],
+        callbacks=callbacks,
+    )
+
+    prediksi = np.insert(optimizer.prediksi[1:], 0, np.nan)
+    result_df = optimizer.get_result_dataframe()
+    result_df["Prediksi"] = prediksi  # Update prediksi dengan NaN awal
+    interval = optimizer.get_interval_tuples()
+    return {
+        "prediksi_manual": np.insert(fts_manual.prediksi[1:], 0, np.nan),
+        "aktual_manual": fts_manual.aktual,
+        "mape_manual": fts_manual.mape,
+        "interval_manual": fts_manual.interval,
+        "z1_manual": fts_manual.z1,
+        "z2_manual": fts_manual.z2,
+        "jumlah_interval_manual": len(fts_manual.interval),
+        "prediksi": prediksi,
+        "aktual": optimizer.aktual,
+        "interval": interval,
+        "mape": optimizer.gbest_score,
+        "z1": optimizer.z1_best,
+        "z2": optimizer.z2_best,
+        "result_df": result_df,
+        "jumlah_interval": len(interval),
+    }
+
+
 class PSOFTSApp:
     def __init__(self):
         if "page" not in st.session_state:
             st.session_state.page = "input"
+        self.restore_job()
         self.route_page()
 
+    def restore_job(self):
+        # Setelah refresh, sesi baru menempel lagi ke job lewat ?job=<id> di URL
+        job_id = st.query_params.get("job")
+        if not job_id or st.session_state.get("job_id") == job_id:
+            return
+        job = get_job_manager().get(job_id)
+        if job is None:
+            return
+        st.session_state.job_id = job_id
+        st.session_state.update(job.context)
+        st.session_state.update(job.params)
+        if job.status == "selesai":
+            show_results(job.result, job.params)
+
     def route_page(self):
         if st.session_state.page == "input":
             self.page_input()
@@ -35,12 +181,12 @@ class PSOFTSApp:
                 return
 
             try:
-                data = pd.read_csv(uploaded_file)
-                data['Tanggal'] = pd.to_datetime(data['Tanggal'])
-                data = data.sort_values(by='Tanggal', ascending=True).reset_index(drop=True)
+                data, stats, fingerprint = parse_upload(uploaded_file.getvalue())
 
                 st.session_state.uploaded_file = uploaded_file
                 st.session_state.data = data
+                st.session_state.data_stats = stats
+                st.session_state.data_fingerprint = fingerprint
                 st.success("✅ Data berhasil dimuat!")
 
             except Exception as e:
@@ -55,9 +201,9 @@ class PSOFTSApp:
 
         st.write("📄 **Preview Data (5 teratas):**", st.session_state.data.head())
 
-        kurs_jual = st.session_state.data['Kurs Jual'].values
-        min_val, max_val = kurs_jual.min(), kurs_jual.max()
-        jumlah_data = len(kurs_jual)
+        stats = st.session_state.data_stats
+        min_val, max_val = stats["min"], stats["max"]
+        jumlah_data = stats["count"]
 
         st.markdown(f"""
         <div style='background-color:#e6f2ff;padding:20px;border-radius:10px;margin-top:20px;'>
@@ -76,41 +222,40 @@ class PSOFTSApp:
             st.session_state.c1 = st.number_input("🔹c1 (koefisien kognitif)", value=st.session_state.get("c1", 1.5))
             st.session_state.c2 = st.number_input("🔸c2 (koefisien sosial)", value=st.session_state.get("c2", 1.5))
             st.session_state.w = st.number_input("🔹w (bobot inersia)", value=st.session_state.get("w", 0.9))
+            st.session_state.seed = st.number_input("🔸Seed", value=st.session_state.get("seed", 42), min_value=0, step=1)
 
         if st.button("Jalankan Prediksi"):
-            with st.spinner("⏳ Sedang melakukan perhitungan..."):
-                fts_manual = FTSLeeManual(st.session_state.data)
-
-                st.session_state.prediksi_manual = np.insert(fts_manual.prediksi[1:], 0, np.nan)
-                st.session_state.aktual_manual = fts_manual.aktual
-                st.session_state.mape_manual = fts_manual.mape
-                st.session_state.interval_manual = fts_manual.interval
-                st.session_state.z1_manual = fts_manual.z1
-                st.session_state.z2_manual = fts_manual.z2
-                st.session_state.jumlah_interval_manual = len(fts_manual.interval)
-
-                optimizer = PSOOptimizer(
-                    st.session_state.data,
-                    st.session_state.n_particles,
-                    st.session_state.n_iterations,
-                    w=st.session_state.w,
-                    c1=st.session_state.c1,
-                    c2=st.session_state.c2
+            params = current_params()
+            key = make_key(st.session_state.data_fingerprint, params)
+            result_cache = get_result_cache()
+            results = result_cache.get(key)
+            if results is not None:
+                show_results(results, params)
+                st.rerun()
+
+            # Perhitungan berjalan di worker latar belakang; halaman hanya memantau progresnya
+            data = st.session_state.data
+            context = {
+                "data": data,
+                "data_stats": st.session_state.data_stats,
+                "data_fingerprint": st.session_state.data_fingerprint,
+            }
+            try:
+                job = get_job_manager().submit(
+                    session_owner(),
+                    params,
+                    lambda callbacks: compute_results(data, params, callbacks),
+                    on_done=lambda results: result_cache.put(key, results),
+                    context=context,
                 )
+            except RuntimeError as e:
+                st.warning(f"⚠️ {e}")
+            else:
+                st.session_state.job_id = job.id
+                st.query_params["job"] = job.id
 
-                st.session_state.prediksi = np.insert(optimizer.prediksi[1:], 0, np.nan)
-                st.session_state.aktual = optimizer.aktual
-                st.session_state.interval = optimizer.get_interval_tuples()
-                st.session_state.mape = optimizer.gbest_score
-                st.session_state.z1 = optimizer.z1_best
-                st.session_state.z2 = optimizer.z2_best
-                result_df = optimizer.get_result_dataframe()
-                result_df["Prediksi"] = st.session_state.prediksi  # Update prediksi dengan NaN awal
-                st.session_state.result_df = result_df
-                st.session_state.jumlah_interval = len(st.session_state.interval)
-
-                st.session_state.page = "output"
-                st.rerun()
+        if "job_id" in st.session_state:
+            job_panel(st.session_state.job_id)
 
     def page_output(self):
         st.markdown("<h1 style='text-align: center;'>📈 Prediksi Nilai Tukar Rupiah", unsafe_allow_html=True)
@@ -151,69 +296,60 @@ class PSOFTSApp:
 
         col1, col2 = st.columns(2)
 
-        df_manual = pd.DataFrame({
-            "No": range(1, len(st.session_state.aktual_manual) + 1),
-            "Tanggal": st.session_state.data['Tanggal'].dt.strftime('%d-%m-%Y'),
-            "Aktual": st.session_state.aktual_manual,
-            "Prediksi": st.session_state.prediksi_manual
-        })
+        # Grafik dirender sekali per hasil (downsampling LTTB untuk deret panjang) lalu diambil dari cache
+        result_id = make_key(st.session_state.data_fingerprint, current_params())
+        figures = get_figure_cache()
+        tanggal = st.session_state.data['Tanggal']
 
         with col1:
             st.subheader("🔹 FTS Lee")
-            st.dataframe(df_manual)
+            paginated_table(tanggal, st.session_state.aktual_manual, st.session_state.prediksi_manual, key="halaman_manual")
             st.markdown(f"<h5 style='color: green;'>MAPE: {st.session_state.mape_manual:.4f}%</h5>", unsafe_allow_html=True)
-            fig_manual, ax_manual = plt.subplots(figsize=(8, 4))
-            ax_manual.plot(st.session_state.data['Tanggal'], st.session_state.aktual_manual, label='Aktual', color='blue', marker='o')
-            ax_manual.plot(st.session_state.data['Tanggal'], st.session_state.prediksi_manual, label='Prediksi', color='red', linestyle='--', marker='x')
-            ax_manual.set_title("FTS Lee: Aktual vs Prediksi")
-            ax_manual.set_xlabel("Tanggal")
-            ax_manual.set_ylabel("Kurs Jual")
-            ax_manual.legend()
-            fig_manual.autofmt_xdate(rotation=45)
-            st.pyplot(fig_manual)
-
-        df_pso = pd.DataFrame({
-            "No": range(1, len(st.session_state.aktual) + 1),
-            "Tanggal": st.session_state.data['Tanggal'].dt.strftime('%d-%m-%Y'),
-            "Aktual": st.session_state.aktual,
-            "Prediksi": st.session_state.prediksi
-        })
+            st.image(figures.get_or_compute((result_id, "manual"), lambda: render_line_chart(
+                tanggal,
+                [
+                    (st.session_state.aktual_manual, 'Aktual', dict(color='blue', marker='o')),
+                    (st.session_state.prediksi_manual, 'Prediksi', dict(color='red', linestyle='--', marker='x')),
+                ],
+                "FTS Lee: Aktual vs Prediksi", "Tanggal", "Kurs Jual",
+            )), width="stretch")
 
         with col2:
             st.subheader("🔸 FTS Lee + PSO")
-            st.dataframe(df_pso)
+            paginated_table(tanggal, st.session_state.aktual, st.session_state.prediksi, key="halaman_pso")
             st.markdown(f"<h5 style='color: green;'>MAPE: {st.session_state.mape:.4f}%</h5>", unsafe_allow_html=True)
-            fig_pso, ax_pso = plt.subplots(figsize=(8, 4))
-            ax_pso.plot(st.session_state.data['Tanggal'], st.session_state.aktual, label='Aktual', color='blue', marker='o')
-            ax_pso.plot(st.session_state.data['Tanggal'], st.session_state.prediksi, label='Prediksi', color='red', linestyle='--', marker='x')
-            ax_pso.set_title("FTS Lee + PSO: Aktual vs Prediksi")
-            ax_pso.set_xlabel("Tanggal")
-            ax_pso.set_ylabel("Kurs Jual")
-            ax_pso.legend()
-            fig_pso.autofmt_xdate(rotation=45)
-            st.pyplot(fig_pso)
+            st.image(figures.get_or_compute((result_id, "pso"), lambda: render_line_chart(
+                tanggal,
+                [
+                    (st.session_state.aktual, 'Aktual', dict(color='blue', marker='o')),
+                    (st.session_state.prediksi, 'Prediksi', dict(color='red', linestyle='--', marker='x')),
+                ],
+                "FTS Lee + PSO: Aktual vs Prediksi", "Tanggal", "Kurs Jual",
+            )), width="stretch")
 
         st.markdown("### 🔀 Perbandingan Prediksi FTS Lee VS FTS Lee PSO", unsafe_allow_html=True)
 
-        fig_all, ax_all = plt.subplots(figsize=(12, 5))
-        ax_all.plot(st.session_state.data['Tanggal'], st.session_state.aktual, label='Aktual', color='green', linewidth=2)
-        ax_all.plot(st.session_state.data['Tanggal'], st.session_state.prediksi_manual, label='Prediksi FTS Lee', color='navy', linewidth=2)
-        ax_all.plot(st.session_state.data['Tanggal'], st.session_state.prediksi, label='Prediksi FTS Lee + PSO', color='red', linewidth=2)
-        ax_all.set_title("Hasil Prediksi", fontsize=14, weight='bold')
-        ax_all.set_xlabel("Tanggal", fontsize=12)
-        ax_all.set_ylabel("Nilai Kurs Jual", fontsize=12)
-        ax_all.legend()
-        ax_all.grid(True)
-        fig_all.autofmt_xdate(rotation=45)
+        png_all = figures.get_or_compute((result_id, "perbandingan"), lambda: render_line_chart(
+            tanggal,
+            [
+                (st.session_state.aktual, 'Aktual', dict(color='green', linewidth=2)),
+                (st.session_state.prediksi_manual, 'Prediksi FTS Lee', dict(color='navy', linewidth=2)),
+                (st.session_state.prediksi, 'Prediksi FTS Lee + PSO', dict(color='red', linewidth=2)),
+            ],
+            "Hasil Prediksi", "Tanggal", "Nilai Kurs Jual", figsize=(12, 5),
+            title_kwargs=dict(fontsize=14, weight='bold'), label_kwargs=dict(fontsize=12), grid=True,
+        ))
 
         with st.container():
             cols = st.columns([1, 6, 1])
             with cols[1]:
-                st.pyplot(fig_all)
+                st.image(png_all, width="stretch")
 
         st.markdown("---")
         if st.button("🔄 Kembali ke Input"):
             st.session_state.page = "input"
+            st.session_state.pop("job_id", None)
+            st.query_params.pop("job", None)
             st.rerun()
 
 # Jalankan Aplikasi
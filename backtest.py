@@ -0,0 +1,175 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_loader import load_kurs_csv
+from model_pso import PSOOptimizer
+
+DEFAULT_PSO_PARAMS = {"n_particles": 10, "n_iterations": 30, "w": 0.9, "c1": 1.5, "c2": 1.5}
+
+
+def window_start(origin, mode, window):
+    return 0 if mode == "expanding" else max(0, origin - window)
+
+
+def forecast_segment(data_series, intervals, first, last, mode="expanding", window=None):
+    # Prediksi satu langkah untuk origin first..last-1. Model pada origin t hanya melihat data[lo:t],
+    # dan matriks FLRG digeser per origin (tambah transisi baru, buang transisi terlama jika rolling)
+    fuzzy_classes = (intervals[:-1] + intervals[1:]) / 2
+    k = len(fuzzy_classes)
+    base = window_start(first, mode, window)
+    states = np.clip(np.searchsorted(intervals, data_series[base:last], side="right") - 1, 0, k - 1)
+
+    counts = np.zeros((k, k), dtype=np.int64)
+    np.add.at(counts, (states[:first - base - 1], states[1:first - base]), 1)
+
+    predictions = np.empty(last - first)
+    lo = base
+    for t in range(first, last):
+        state = states[t - 1 - base]
+        row = counts[state]
+        total = row.sum()
+        # Himpunan yang belum punya FLRG memprediksi nilai tengahnya sendiri
+        predictions[t - first] = row @ fuzzy_classes / total if total else fuzzy_classes[state]
+
+        counts[state, states[t - base]] += 1
+        new_lo = window_start(t + 1, mode, window)
+        while lo < new_lo:
+            counts[states[lo - base], states[lo + 1 - base]] -= 1
+            lo += 1
+    return predictions
+
+
+class WalkForwardBacktest:
+    # Backtest out-of-sample: setiap origin t memprediksi a_t dari data sebelum t saja.
+    # Interval dicari PSO pada jendela awal, lalu (opsional) dioptimasi ulang setiap reoptimize_every
+    # origin dengan warm start dari gbest sebelumnya; di antara refit, FLRG diperbarui secara inkremental.
+    def __init__(self, data, initial_window, mode="expanding", window=None, reoptimize_every=None,
+                 intervals=None, pso_params=None, refit_iterations=10, executor="serial", n_workers=None):
+        if mode not in ("expanding", "rolling"):
+            raise ValueError("mode harus 'expanding' atau 'rolling'")
+        self.data = data
+        self.data_series = np.asarray(data['Kurs Jual'].values, dtype=float)
+        self.initial_window = initial_window
+        self.mode = mode
+        self.window = window or initial_window
+        self.reoptimize_every = reoptimize_every
+        self.pso_params = {**DEFAULT_PSO_PARAMS, **(pso_params or {})}
+        self.refit_iterations = refit_iterations
+        self.executor = executor
+        self.n_workers = n_workers
+        if not 2 <= initial_window < len(self.data_series):
+            raise ValueError("initial_window harus di antara 2 dan panjang data - 1")
+        if mode == "rolling" and self.window < 2:
+            raise ValueError("window rolling minimal 2")
+
+        self.refits = []
+        self.prediksi = None
+        self.aktual = None
+        self.mape = None
+
+        self.blocks = self.fit_blocks(intervals)
+        self.run()
+
+    def training_frame(self, origin):
+        lo = window_start(origin, self.mode, self.window)
+        return pd.DataFrame({'Kurs Jual': self.data_series[lo:origin]})
+
+    def fit_blocks(self, intervals):
+        # Optimasi PSO berurutan (tiap refit butuh gbest sebelumnya); hasilnya daftar (awal, akhir, interval)
+        n = len(self.data_series)
+        step = self.reoptimize_every or n
+        origins = list(range(self.initial_window, n, step)) + [n]
+        blocks = []
+        gbest = None
+        for first, last in zip(origins[:-1], origins[1:]):
+            if intervals is not None and not blocks:
+                block_intervals = np.asarray(intervals, dtype=float)
+            else:
+                params = dict(self.pso_params)
+                if gbest is not None:
+                    params.update(n_iterations=self.refit_iterations, warm_start=gbest)
+                optimizer = PSOOptimizer(self.training_frame(first), **params)
+                gbest = optimizer.gbest
+                block_intervals = optimizer.best_intervals
+                self.refits.append({"origin": first, "mape_in_sample": optimizer.gbest_score,
+                                    "n_intervals": len(block_intervals) - 1})
+            blocks.append((first, last, block_intervals))
+        return blocks
+
+    def segments(self):
+        # Setiap blok dipecah menjadi potongan origin berurutan, satu per worker
+        n_workers = self.n_workers or 1
+        for first, last, intervals in self.blocks:
+            bounds = np.linspace(first, last, min(n_workers, last - first) + 1).astype(int)
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                yield start, end, intervals
+
+    def run(self):
+        jobs = list(self.segments())
+        if self.executor == "process":
+            with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+                futures = [pool.submit(forecast_segment, self.data_series, intervals, start, end, self.mode, self.window)
+                           for start, end, intervals in jobs]
+                parts = [future.result() for future in futures]
+        else:
+            parts = [forecast_segment(self.data_series, intervals, start, end, self.mode, self.window)
+                     for start, end, intervals in jobs]
+
+        self.prediksi = np.concatenate(parts)
+        self.aktual = self.data_series[self.initial_window:]
+        self.mape = np.mean(np.abs((self.aktual - self.prediksi) / self.aktual)) * 100
+
+    def get_result_dataframe(self):
+        result = pd.DataFrame({
+            'Aktual': self.aktual,
+            'Prediksi': self.prediksi,
+            'Error (%)': np.abs((self.aktual - self.prediksi) / self.aktual) * 100,
+        })
+        if 'Tanggal' in self.data:
+            result.insert(0, 'Tanggal', self.data['Tanggal'].values[self.initial_window:])
+        return result
+
+    def get_refit_dataframe(self):
+        return pd.DataFrame(self.refits).rename(columns={
+            "origin": "Origin",
+            "mape_in_sample": "MAPE In-Sample",
+            "n_intervals": "Jumlah Interval",
+        })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest walk-forward FTS Lee + PSO (prediksi satu langkah out-of-sample).")
+    parser.add_argument("csv")
+    parser.add_argument("--initial-window", type=int, default=None, help="panjang data latih awal (bawaan: separuh data)")
+    parser.add_argument("--mode", choices=["expanding", "rolling"], default="expanding")
+    parser.add_argument("--window", type=int, default=None, help="panjang jendela rolling (bawaan: initial-window)")
+    parser.add_argument("--reoptimize-every", type=int, default=None, help="jalankan ulang PSO setiap N origin")
+    parser.add_argument("--particles", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=None, help="simpan prediksi per origin ke CSV")
+    args = parser.parse_args(argv)
+
+    data, _ = load_kurs_csv(args.csv)
+    backtest = WalkForwardBacktest(
+        data,
+        args.initial_window or len(data) // 2,
+        mode=args.mode,
+        window=args.window,
+        reoptimize_every=args.reoptimize_every,
+        pso_params={"n_particles": args.particles, "n_iterations": args.iterations, "seed": args.seed},
+        executor="process" if args.workers and args.workers > 1 else "serial",
+        n_workers=args.workers,
+    )
+    print(backtest.get_refit_dataframe().to_string(index=False))
+    print(f"MAPE out-of-sample ({len(backtest.prediksi)} origin): {backtest.mape:.4f}%")
+    if args.output:
+        backtest.get_result_dataframe().to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
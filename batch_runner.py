@@ -0,0 +1,141 @@
+import argparse
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_loader import load_kurs_csv
+from fts_manual import FTSLeeManual
+from model_pso import PSOOptimizer, spawn_seeds
+
+
+def currency_name(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return re.sub(r"^Kurs Transaksi", "", stem).strip() or stem
+
+
+def run_currency(path, params):
+    # File yang gagal diproses dicatat sebagai baris ringkasan dengan pesan galat, batch tetap berjalan
+    try:
+        return fit_currency(path, params)
+    except Exception as exc:
+        summary = {"Mata Uang": currency_name(path), "File": os.path.basename(path),
+                   "Galat": f"{type(exc).__name__}: {exc}"}
+        return summary, pd.DataFrame()
+
+
+def fit_currency(path, params):
+    data, _ = load_kurs_csv(path, window=params.get("window"))
+
+    fts_manual = FTSLeeManual(data)
+    optimizer = PSOOptimizer(
+        data,
+        params["n_particles"],
+        params["n_iterations"],
+        w=params["w"],
+        c1=params["c1"],
+        c2=params["c2"],
+        seed=params["seed"],
+        verbose=False,
+    )
+
+    currency = currency_name(path)
+    if params.get("model_dir"):
+        optimizer.to_model().save(os.path.join(params["model_dir"], f"{currency}.ftsl"))
+
+    summary = {
+        "Mata Uang": currency,
+        "File": os.path.basename(path),
+        "Jumlah Data": len(data),
+        "MAPE FTS Lee": fts_manual.mape,
+        "MAPE FTS Lee + PSO": optimizer.gbest_score,
+        "Jumlah Interval FTS Lee": len(fts_manual.interval),
+        "Jumlah Interval FTS Lee + PSO": len(optimizer.best_intervals) - 1,
+        "Z1 Terbaik": optimizer.z1_best,
+        "Z2 Terbaik": optimizer.z2_best,
+        "Batas Interval FTS Lee + PSO": " ".join(f"{batas:.2f}" for batas in optimizer.best_intervals),
+        "Galat": None,
+    }
+    # Prediksi pertama selalu NaN, sama seperti tampilan di aplikasi
+    predictions = pd.DataFrame({
+        "Mata Uang": currency,
+        "Tanggal": data['Tanggal'],
+        "Aktual": data['Kurs Jual'],
+        "Prediksi FTS Lee": np.insert(fts_manual.prediksi[1:], 0, np.nan),
+        "Prediksi FTS Lee + PSO": np.insert(optimizer.prediksi[1:], 0, np.nan),
+    })
+    return summary, predictions
+
+
+def run_batch(paths, params, n_workers=None):
+    # Satu proses per mata uang; urutan hasil mengikuti urutan file
+    seeds = spawn_seeds(len(paths)) if params.get("seed") is None else [params["seed"]] * len(paths)
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        results = list(pool.map(run_currency, paths, [dict(params, seed=seed) for seed in seeds]))
+    summary = pd.DataFrame([summary for summary, _ in results])
+    # Baris gagal tidak punya angka, kolom hitungan tetap bilangan bulat
+    for column in ("Jumlah Data", "Jumlah Interval FTS Lee", "Jumlah Interval FTS Lee + PSO"):
+        if column in summary:
+            summary[column] = summary[column].astype("Int64")
+    predictions = pd.concat([predictions for _, predictions in results], ignore_index=True)
+    return summary, predictions
+
+
+def expand_paths(patterns):
+    paths = []
+    for pattern in patterns:
+        # Pola tanpa file yang cocok dilewati
+        matches = sorted(glob.glob(pattern))
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan FTS Lee dan FTS Lee + PSO untuk banyak file kurs sekaligus.")
+    parser.add_argument("files", nargs="*", default=["Kurs Transaksi *.csv"], help="file CSV atau pola glob")
+    parser.add_argument("--output-dir", default="hasil", help="folder untuk ringkasan.csv dan prediksi.csv")
+    parser.add_argument("--particles", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--w", type=float, default=0.9)
+    parser.add_argument("--c1", type=float, default=1.5)
+    parser.add_argument("--c2", type=float, default=1.5)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--window", type=int, default=None, help="hanya pakai N data terbaru per mata uang")
+    parser.add_argument("--model-dir", default=None, help="simpan model FTS Lee + PSO per mata uang (<kode>.ftsl)")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses paralel (default: jumlah core)")
+    args = parser.parse_args(argv)
+
+    paths = expand_paths(args.files)
+    if not paths:
+        parser.error("tidak ada file CSV yang ditemukan")
+
+    params = {
+        "n_particles": args.particles,
+        "n_iterations": args.iterations,
+        "w": args.w,
+        "c1": args.c1,
+        "c2": args.c2,
+        "seed": args.seed,
+        "window": args.window,
+        "model_dir": args.model_dir,
+    }
+    if args.model_dir:
+        os.makedirs(args.model_dir, exist_ok=True)
+    summary, predictions = run_batch(paths, params, n_workers=args.workers)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    summary.to_csv(os.path.join(args.output_dir, "ringkasan.csv"), index=False)
+    predictions.to_csv(os.path.join(args.output_dir, "prediksi.csv"), index=False)
+    columns = ["Mata Uang", "Jumlah Data", "MAPE FTS Lee", "MAPE FTS Lee + PSO"]
+    print(summary.reindex(columns=columns).to_string(index=False))
+    failed = summary[summary["Galat"].notna()]
+    for _, row in failed.iterrows():
+        print(f"Gagal memproses {row['File']}: {row['Galat']}")
+    return 1 if len(failed) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
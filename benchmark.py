@@ -0,0 +1,148 @@
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data_loader import load_kurs_csv
+from fts_manual import FTSLeeManual
+from model_pso import PSOOptimizer
+
+BUNDLED_CSV = "Kurs Transaksi USD.csv"
+
+FULL_GRID = {
+    "lengths": ["csv", 1_000, 10_000, 100_000],
+    "particles": [10, 50, 200],
+    "intervals": [5, 10, 15],
+    "iterations": 20,
+}
+QUICK_GRID = {
+    "lengths": ["csv", 10_000],
+    "particles": [10, 50],
+    "intervals": [10],
+    "iterations": 5,
+}
+
+
+def synthetic_series(n, seed=0):
+    # Random walk dengan skala mirip kurs Rupiah
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"Kurs Jual": np.round(15000 + np.cumsum(rng.normal(0, 25, n)), 2)})
+
+
+def load_series(length):
+    if length == "csv":
+        data, _ = load_kurs_csv(BUNDLED_CSV)
+        return data
+    return synthetic_series(length)
+
+
+def measure(func, repeat):
+    # Waktu terbaik dari beberapa ulangan; memori puncak diukur terpisah agar tracemalloc tidak memperlambat waktu
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak / 1e6
+
+
+def bench_fts_manual(data, repeat):
+    wall, peak = measure(lambda: FTSLeeManual(data), repeat)
+    return {"wall_time": wall, "evals_per_sec": 1 / wall, "peak_mem_mb": peak}
+
+
+def bench_run_fts_lee(data, n_intervals, repeat):
+    optimizer = PSOOptimizer(data, 2, 1, 0.9, 1.5, 1.5, seed=0, verbose=False, n_intervals=n_intervals)
+    particle = optimizer.initialize_particles()[0]
+    intervals = optimizer.generate_intervals(particle[0], particle[1], particle[2:])
+    wall, peak = measure(lambda: optimizer.run_fts_lee(intervals), repeat)
+    return {"wall_time": wall, "evals_per_sec": 1 / wall, "peak_mem_mb": peak}
+
+
+def bench_pso_run(data, n_particles, n_intervals, n_iterations, repeat):
+    run = lambda: PSOOptimizer(data, n_particles, n_iterations, 0.9, 1.5, 1.5,
+                               seed=0, verbose=False, n_intervals=n_intervals)
+    wall, peak = measure(run, repeat)
+    return {"wall_time": wall, "evals_per_sec": n_particles * n_iterations / wall, "peak_mem_mb": peak}
+
+
+def run_suite(grid, repeat=3, log=print):
+    results = []
+
+    def record(name, params, metrics):
+        results.append({"name": name, "params": params, **metrics})
+        log(f"{name:<14} {json.dumps(params):<60} {metrics['wall_time'] * 1000:10.2f} ms "
+            f"{metrics['evals_per_sec']:12.1f} eval/s {metrics['peak_mem_mb']:9.2f} MB")
+
+    for length in grid["lengths"]:
+        data = load_series(length)
+        n = len(data)
+        record("fts_manual", {"n": n}, bench_fts_manual(data, repeat))
+        for n_intervals in grid["intervals"]:
+            record("run_fts_lee", {"n": n, "intervals": n_intervals},
+                   bench_run_fts_lee(data, n_intervals, repeat))
+            for n_particles in grid["particles"]:
+                params = {"n": n, "particles": n_particles, "intervals": n_intervals,
+                          "iterations": grid["iterations"]}
+                record("pso_run", params,
+                       bench_pso_run(data, n_particles, n_intervals, grid["iterations"], repeat))
+    return results
+
+
+def result_key(result):
+    return result["name"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results, baseline, log=print):
+    previous = {result_key(result): result for result in baseline["results"]}
+    log("\nPerbandingan dengan baseline (rasio waktu baru / lama):")
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        ratio = result["wall_time"] / old["wall_time"]
+        flag = "  REGRESI" if ratio > 1.1 else ""
+        log(f"{result['name']:<14} {json.dumps(result['params']):<60} {ratio:6.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark jalur utama FTS Lee dan PSO.")
+    parser.add_argument("--quick", action="store_true", help="grid kecil untuk pengecekan cepat")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", default=None, help="file JSON hasil benchmark sebelumnya")
+    args = parser.parse_args(argv)
+
+    grid = QUICK_GRID if args.quick else FULL_GRID
+    results = run_suite(grid, repeat=args.repeat)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "grid": grid,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+COLUMNS = ["Tanggal", "Kurs Jual"]
+
+
+def parse_dates(values, date_format=DATE_FORMAT):
+    try:
+        return pd.to_datetime(values, format=date_format).to_numpy(dtype="datetime64[ns]")
+    except (ValueError, TypeError):
+        # File dengan format tanggal lain tetap bisa dibaca, hanya lebih lambat
+        return pd.to_datetime(values, format="mixed").to_numpy(dtype="datetime64[ns]")
+
+
+def keep_latest(dates, values, window):
+    if len(dates) <= window:
+        return dates, values
+    keep = np.argpartition(dates, len(dates) - window)[-window:]
+    return dates[keep], values[keep]
+
+
+# Membaca file kurs per potongan dan hanya menyimpan Tanggal dan Kurs Jual sebagai array.
+# window membatasi ke N data terbaru dan step mengambil setiap baris ke-step, sehingga
+# file yang lebih besar dari RAM tetap bisa diproses. Hasil: (DataFrame urut tanggal, statistik).
+def load_kurs_csv(source, chunksize=100_000, date_format=DATE_FORMAT, dtype=np.float64, window=None, step=1):
+    date_parts, value_parts = [], []
+    total_rows = 0
+    reader = pd.read_csv(source, usecols=COLUMNS, dtype={"Kurs Jual": dtype}, chunksize=chunksize)
+    for chunk in reader:
+        offset = (step - total_rows % step) % step
+        total_rows += len(chunk)
+        chunk = chunk.iloc[offset::step]
+
+        dates = parse_dates(chunk["Tanggal"], date_format)
+        values = chunk["Kurs Jual"].to_numpy(dtype=dtype)
+        valid = ~np.isnan(values) & ~np.isnat(dates)
+        date_parts.append(dates[valid])
+        value_parts.append(values[valid])
+
+        if window is not None:
+            dates, values = keep_latest(np.concatenate(date_parts), np.concatenate(value_parts), window)
+            date_parts, value_parts = [dates], [values]
+
+    dates = np.concatenate(date_parts) if date_parts else np.array([], dtype="datetime64[ns]")
+    values = np.concatenate(value_parts) if value_parts else np.array([], dtype=dtype)
+    order = np.argsort(dates, kind="stable")
+    data = pd.DataFrame({"Tanggal": dates[order], "Kurs Jual": values[order]})
+
+    stats = {
+        "min": float(values.min()) if len(values) else np.nan,
+        "max": float(values.max()) if len(values) else np.nan,
+        "count": len(values),
+        "total_rows": total_rows,
+    }
+    return data, stats
+
+
+def data_fingerprint(data):
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(data["Tanggal"].to_numpy(dtype="datetime64[ns]")).tobytes())
+    digest.update(np.ascontiguousarray(data["Kurs Jual"].to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from fts_model import FTSLeeModel, series_fingerprint
+
 class FTSLeeManual:
     def __init__(self, data):
         self.data_series = data['Kurs Jual'].values
@@ -11,6 +13,13 @@ class FTSLeeManual:
         self.z1 = None
         self.z2 = None
 
+        # Hasil mesin array: kode himpunan (0 = A1), FLR dan matriks FLRG
+        self.intervals = None
+        self.fuzzified = None
+        self.flr = None
+        self.flrg_counts = None
+        self.representasi = None
+
         self.run()
 
     def run(self):
@@ -48,73 +57,98 @@ class FTSLeeManual:
         actual, predicted = np.array(actual), np.array(predicted)
         return np.mean(np.abs((actual - predicted) / actual)) * 100
 
-    def fuzzyfikasi(self, kurs, df_himpunan):
-        for _, row in df_himpunan.iterrows():
-            if row['Batas Bawah'] <= kurs <= row['Batas Atas']:
-                return row['Kelas Interval(Ai)']
-        return "Unknown"
-
-    def calculate_flr(self, df_data):
-        flr = ["NaN"]
-        for i in range(1, len(df_data)):
-            current_state = df_data.iloc[i]['Fuzzyfikasi']
-            next_state = df_data.iloc[i + 1]['Fuzzyfikasi'] if i + 1 < len(df_data) else current_state
-            flr.append(f"{current_state} → {next_state}")
-        df_data['FLR'] = flr
-
-    def calculate_flrg(self, df_data):
-        flrg = {}
-        for i in range(1, len(df_data)):
-            current_flr = df_data.iloc[i]['FLR']
-            if isinstance(current_flr, str) and '→' in current_flr:
-                from_state, to_state = current_flr.split(' → ')
-                if from_state not in flrg:
-                    flrg[from_state] = []
-                flrg[from_state].append(to_state)
-        return flrg
+    def fuzzyfikasi(self, data_series, intervals):
+        # Interval pertama yang memuat nilai menang, jadi nilai tepat di batas masuk ke interval bawah
+        jumlah_himpunan = len(intervals) - 1
+        fuzzified = np.searchsorted(intervals, data_series, side='left') - 1
+        return np.clip(fuzzified, 0, jumlah_himpunan - 1)
+
+    def calculate_flr(self, fuzzified):
+        # FLR dimulai dari data kedua; data terakhir berelasi ke dirinya sendiri
+        if len(fuzzified) < 2:
+            return fuzzified[:0], fuzzified[:0]
+        from_states = fuzzified[1:]
+        to_states = np.append(fuzzified[2:], fuzzified[-1])
+        return from_states, to_states
+
+    def calculate_flrg(self, flr, jumlah_himpunan):
+        from_states, to_states = flr
+        counts = np.bincount(from_states * jumlah_himpunan + to_states, minlength=jumlah_himpunan * jumlah_himpunan)
+        return counts.reshape(jumlah_himpunan, jumlah_himpunan)
 
     def get_fuzzy_representations(self, min_val, max_val, jumlah_himpunan):
         interval = (max_val - min_val) / jumlah_himpunan
-        representasi = {}
-        for i in range(jumlah_himpunan):
-            lower = min_val + i * interval
-            upper = lower + interval
-            mean = (lower + upper) / 2
-            representasi[f"A{i+1}"] = round(mean, 2)
-        return representasi
-
-    def defuzzify_lee(self, df_data, flrg, representasi):
-        prediksi_list = []
-        for i in range(len(df_data)):
-            current_state = df_data.iloc[i]['Fuzzyfikasi']
-            if current_state in flrg:
-                next_states = flrg[current_state]
-                nilai_anggota = [representasi[state] for state in next_states if state in representasi]
-                total = sum(nilai_anggota)
-                count = len(nilai_anggota)
-                prediksi = round(total / count, 2) if count > 0 else float('nan')
-            else:
-                prediksi = float('nan')
-            prediksi_list.append(prediksi)
-        df_data['Prediksi'] = prediksi_list
-        return df_data
+        lower = min_val + np.arange(jumlah_himpunan) * interval
+        upper = lower + interval
+        mean = (lower + upper) / 2
+        return np.round(mean, 2)
+
+    def defuzzify_lee(self, fuzzified, flr, representasi):
+        # bincount menjumlahkan bobot sesuai urutan kemunculan FLR, sama seperti sum() per FLRG
+        from_states, to_states = flr
+        jumlah_himpunan = len(representasi)
+        total = np.bincount(from_states, weights=representasi[to_states], minlength=jumlah_himpunan)
+        count = np.bincount(from_states, minlength=jumlah_himpunan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            nilai = np.where(count > 0, np.round(total / count, 2), np.nan)
+        return nilai[fuzzified]
 
     def run_fts_lee(self, data_series, intervals):
         jumlah_himpunan = len(intervals) - 1
-        df_himpunan = pd.DataFrame({
+        fuzzified = self.fuzzyfikasi(data_series, intervals)
+        flr = self.calculate_flr(fuzzified)
+        representasi = self.get_fuzzy_representations(np.min(data_series), np.max(data_series), jumlah_himpunan)
+        predictions = self.defuzzify_lee(fuzzified, flr, representasi)
+
+        self.intervals = intervals
+        self.fuzzified = fuzzified
+        self.flr = flr
+        self.flrg_counts = self.calculate_flrg(flr, jumlah_himpunan)
+        self.representasi = representasi
+        return predictions  # Ambil semua, termasuk NaN di awal
+
+    def to_model(self):
+        return FTSLeeModel(
+            self.intervals,
+            self.representasi,
+            self.flrg_counts,
+            last_state=self.fuzzified[-1],
+            n_data=len(self.data_series),
+            mape=self.mape,
+            side='left',
+            decimals=2,
+            self_loop_last=True,
+            z1=self.z1,
+            z2=self.z2,
+            fingerprint=series_fingerprint(self.data_series),
+        )
+
+    def get_fuzzy_labels(self):
+        return np.array([f"A{i+1}" for i in range(len(self.intervals) - 1)])[self.fuzzified]
+
+    def get_flr_labels(self):
+        from_states, to_states = self.flr
+        return ["NaN"] + [f"A{a+1} → A{b+1}" for a, b in zip(from_states.tolist(), to_states.tolist())]
+
+    def get_flrg(self):
+        flrg = {}
+        from_states, to_states = self.flr
+        for a, b in zip(from_states.tolist(), to_states.tolist()):
+            flrg.setdefault(f"A{a+1}", []).append(f"A{b+1}")
+        return flrg
+
+    def get_himpunan_dataframe(self):
+        jumlah_himpunan = len(self.intervals) - 1
+        return pd.DataFrame({
             "Kelas Interval(Ai)": [f"A{i+1}" for i in range(jumlah_himpunan)],
-            "Batas Bawah": intervals[:-1],
-            "Batas Atas": intervals[1:]
+            "Batas Bawah": self.intervals[:-1],
+            "Batas Atas": self.intervals[1:]
         })
 
-        df_data = pd.DataFrame(data_series, columns=["Kurs Jual"])
+    def get_detail_dataframe(self):
+        df_data = pd.DataFrame(self.data_series, columns=["Kurs Jual"])
         df_data['No'] = df_data.index + 1
-        df_data['Fuzzyfikasi'] = df_data['Kurs Jual'].apply(lambda x: self.fuzzyfikasi(x, df_himpunan))
-
-        self.calculate_flr(df_data)
-        flrg = self.calculate_flrg(df_data)
-        representasi = self.get_fuzzy_representations(np.min(data_series), np.max(data_series), jumlah_himpunan)
-        df_data = self.defuzzify_lee(df_data, flrg, representasi)
-
-        predictions = df_data['Prediksi'].values  # Ambil semua, termasuk NaN di awal
-        return predictions
+        df_data['Fuzzyfikasi'] = self.get_fuzzy_labels()
+        df_data['FLR'] = self.get_flr_labels()
+        df_data['Prediksi'] = self.prediksi
+        return df_data
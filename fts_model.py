@@ -0,0 +1,161 @@
+import hashlib
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"FTSL"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHI")
+
+
+def series_fingerprint(values):
+    return hashlib.sha256(np.ascontiguousarray(values, dtype=np.float64).tobytes()).hexdigest()
+
+
+def state_predictions_from_counts(counts, fuzzy_classes):
+    # Prediksi Lee per himpunan: rata-rata nilai tengah tujuan FLRG, NaN untuk himpunan tanpa FLRG.
+    # counts (..., k, k) dan fuzzy_classes (..., k), jadi bisa untuk satu model maupun seluruh swarm
+    totals = counts.sum(axis=-1)
+    weighted = np.matmul(counts, fuzzy_classes[..., None])[..., 0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(totals > 0, weighted / totals, np.nan)
+
+
+class FTSLeeModel:
+    # Model FTS Lee yang sudah dilatih: batas interval, nilai tengah himpunan dan matriks FLRG.
+    # Data baru bisa ditambahkan satu per satu tanpa melatih ulang (O(k) per titik).
+    def __init__(self, intervals, fuzzy_classes, flrg_counts, last_state, n_data, mape,
+                 side="right", decimals=None, self_loop_last=False, z1=None, z2=None, seed=None,
+                 fingerprint=None):
+        self.intervals = np.asarray(intervals, dtype=float)
+        self.fuzzy_classes = np.asarray(fuzzy_classes, dtype=float)
+        self.flrg_counts = np.array(flrg_counts, dtype=np.int64)
+        self.last_state = int(last_state)
+        self.n_data = int(n_data)
+        self.side = side
+        self.decimals = decimals
+        # FTSLeeManual menambahkan relasi A_i -> A_i untuk data terakhir
+        self.self_loop_last = self_loop_last
+        self.z1 = z1
+        self.z2 = z2
+        self.seed = seed
+        self.fingerprint = fingerprint
+        self._state_pred = None
+
+        # MAPE berjalan: data pertama tidak punya prediksi
+        self.n_errors = max(self.n_data - 1, 0) if np.isfinite(mape) else 0
+        self.ape_sum = mape / 100 * self.n_errors if self.n_errors else 0.0
+
+    @property
+    def n_intervals(self):
+        return len(self.intervals) - 1
+
+    @property
+    def mape(self):
+        return self.ape_sum / self.n_errors * 100 if self.n_errors else np.nan
+
+    def fuzzify(self, values):
+        # Nilai di luar semesta pembicaraan masuk ke himpunan paling tepi
+        states = np.searchsorted(self.intervals, values, side=self.side) - 1
+        return np.clip(states, 0, self.n_intervals - 1)
+
+    def state_predictions(self):
+        if self._state_pred is None:
+            self._state_pred = self.compute_state_predictions()
+        return self._state_pred
+
+    def compute_state_predictions(self):
+        pred = state_predictions_from_counts(self.flrg_counts, self.fuzzy_classes)
+        return pred if self.decimals is None else np.round(pred, self.decimals)
+
+    def state_prediction(self, state):
+        row = self.flrg_counts[state]
+        total = row.sum()
+        if total == 0:
+            return np.nan
+        pred = (row @ self.fuzzy_classes) / total
+        return pred if self.decimals is None else np.round(pred, self.decimals)
+
+    def predict(self, values):
+        return self.state_predictions()[self.fuzzify(values)]
+
+    def append(self, observation):
+        state = int(self.fuzzify(observation))
+        if self.self_loop_last:
+            self.flrg_counts[self.last_state, self.last_state] -= 1
+            self.flrg_counts[state, state] += 1
+        self.flrg_counts[self.last_state, state] += 1
+        self.last_state = state
+        self.n_data += 1
+        self._state_pred = None
+
+        # Prediksi titik baru memakai FLRG himpunannya sendiri (sama seperti run_fts_lee);
+        # error titik lama tidak dihitung ulang, dan himpunan tanpa FLRG (NaN) dilewati
+        pred = self.state_prediction(state)
+        if not np.isnan(pred):
+            self.ape_sum += abs((observation - pred) / observation)
+            self.n_errors += 1
+        return pred
+
+    def extend(self, observations):
+        return np.array([self.append(observation) for observation in observations])
+
+    # Artefak biner: header tetap, metadata JSON, lalu array mentah (interval, nilai himpunan, FLRG)
+    def to_bytes(self):
+        meta = json.dumps({
+            "n_intervals": self.n_intervals,
+            "last_state": self.last_state,
+            "n_data": self.n_data,
+            "n_errors": self.n_errors,
+            "ape_sum": self.ape_sum,
+            "side": self.side,
+            "decimals": self.decimals,
+            "self_loop_last": self.self_loop_last,
+            "z1": None if self.z1 is None else float(self.z1),
+            "z2": None if self.z2 is None else float(self.z2),
+            "seed": self.seed,
+            "fingerprint": self.fingerprint,
+        }).encode()
+        return b"".join((
+            HEADER.pack(MAGIC, FORMAT_VERSION, len(meta)),
+            meta,
+            self.intervals.astype("<f8").tobytes(),
+            self.fuzzy_classes.astype("<f8").tobytes(),
+            self.flrg_counts.astype("<i8").tobytes(),
+        ))
+
+    @classmethod
+    def from_bytes(cls, payload):
+        magic, version, meta_len = HEADER.unpack_from(payload)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("bukan artefak FTSLeeModel yang didukung")
+        offset = HEADER.size
+        meta = json.loads(payload[offset:offset + meta_len])
+        offset += meta_len
+
+        k = meta["n_intervals"]
+        intervals = np.frombuffer(payload, dtype="<f8", count=k + 1, offset=offset)
+        offset += intervals.nbytes
+        fuzzy_classes = np.frombuffer(payload, dtype="<f8", count=k, offset=offset)
+        offset += fuzzy_classes.nbytes
+        flrg_counts = np.frombuffer(payload, dtype="<i8", count=k * k, offset=offset).reshape(k, k)
+
+        model = cls.__new__(cls)
+        model.intervals = intervals
+        model.fuzzy_classes = fuzzy_classes
+        model.flrg_counts = flrg_counts.copy()
+        for name in ("last_state", "n_data", "n_errors", "ape_sum", "side", "decimals",
+                     "self_loop_last", "z1", "z2", "seed", "fingerprint"):
+            setattr(model, name, meta[name])
+        model._state_pred = None
+        return model
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
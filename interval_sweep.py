@@ -0,0 +1,97 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_pso import PSOOptimizer, SwarmEvaluator, spawn_seeds
+from swarm_parallel import SharedPool
+
+
+def _optimize_k(params, evaluator):
+    data = pd.DataFrame({'Kurs Jual': evaluator.data_series})
+    start = time.perf_counter()
+    optimizer = PSOOptimizer(data, evaluator=evaluator, **params)
+    return {
+        "n_intervals": int(optimizer.n_intervals),
+        "gbest_score": optimizer.gbest_score,
+        "swarm_state": optimizer.swarm_state,
+        "history": optimizer.mape_per_iter,
+        "iterations": optimizer.iterations_run,
+        "stop_reason": optimizer.stop_reason,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+class IntervalSweep:
+    # Optimasi PSO untuk setiap jumlah interval k dalam rentang sekaligus. Data terurut, rank dan
+    # indeks transisi dihitung sekali dan dibagi ke semua worker. Run per k berjalan bersamaan di thread
+    # proses utama, dan evaluasi swarm tiap iterasinya dipecah ke satu pool proses bersama,
+    # jadi jumlah core yang terpakai tidak dibatasi oleh jumlah k.
+    def __init__(self, data, n_particles, n_iterations, w, c1, c2, k_range=range(5, 16), seed=None,
+                 executor="process", n_workers=None, **pso_kwargs):
+        self.data = data
+        self.k_values = [int(k) for k in k_range]
+        self.executor = executor
+        self.n_workers = n_workers
+        seeds = spawn_seeds(len(self.k_values)) if seed is None else [seed] * len(self.k_values)
+        self.params = {
+            k: dict(n_particles=n_particles, n_iterations=n_iterations, w=w, c1=c1, c2=c2,
+                    seed=k_seed, n_intervals=k, verbose=False, **pso_kwargs)
+            for k, k_seed in zip(self.k_values, seeds)
+        }
+        self.evaluator = SwarmEvaluator(np.asarray(data['Kurs Jual'].values, dtype=float))
+        self.results = {}
+        self.best = None
+        self.best_k = None
+
+        self.run()
+
+    def run(self):
+        # k besar lebih mahal, jadi dikirim lebih dulu agar worker tidak menganggur di akhir
+        order = sorted(self.k_values, reverse=True)
+        if self.executor == "process":
+            # Indeks transisi dibangun sekali sebelum disalin ke shared memory
+            if any(self.evaluator.uses_index(k + 1) for k in self.k_values):
+                self.evaluator.build_index()
+            with SharedPool(self.evaluator, self.n_workers) as pool:
+                with ThreadPoolExecutor(max_workers=len(self.k_values)) as runners:
+                    futures = {k: runners.submit(_optimize_k, dict(self.params[k], executor=pool), self.evaluator)
+                               for k in order}
+                    self.results = {k: futures[k].result() for k in self.k_values}
+        elif self.executor == "thread":
+            with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+                futures = {k: pool.submit(_optimize_k, self.params[k], self.evaluator) for k in order}
+                self.results = {k: futures[k].result() for k in self.k_values}
+        else:
+            self.results = {k: _optimize_k(self.params[k], self.evaluator) for k in self.k_values}
+
+        self.best_k = min(self.k_values, key=lambda k: self.results[k]["gbest_score"])
+        # Run 0 iterasi dari swarm k terbaik: interval, prediksi dan model seperti PSOOptimizer biasa
+        self.best = PSOOptimizer(self.data, evaluator=self.evaluator, swarm_state=self.results[self.best_k]["swarm_state"],
+                                 **dict(self.params[self.best_k], n_iterations=0))
+
+    @property
+    def gbest_score(self):
+        return self.best.gbest_score
+
+    def get_sweep_dataframe(self):
+        rows = []
+        for k in self.k_values:
+            result = self.results[k]
+            gbest = result["swarm_state"]["gbest"]
+            rows.append({
+                "Jumlah Interval": k,
+                "MAPE": result["gbest_score"],
+                "Z1": gbest[0],
+                "Z2": gbest[1],
+                "Iterasi": result["iterations"],
+                "Waktu (detik)": result["elapsed"],
+            })
+        return pd.DataFrame(rows)
+
+    def get_history_dataframe(self):
+        return pd.DataFrame({f"k = {k}": pd.Series(self.results[k]["history"], dtype=float) for k in self.k_values})
+
+    def to_model(self):
+        return self.best.to_model()
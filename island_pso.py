@@ -0,0 +1,142 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_pso import PSOOptimizer, SwarmEvaluator, spawn_seeds
+
+_island_data = None
+_island_evaluator = None
+
+
+def _init_island(data_series):
+    # Data dan evaluator dibangun sekali per proses, lalu dipakai ulang di setiap epoch
+    global _island_data, _island_evaluator
+    _island_data = pd.DataFrame({'Kurs Jual': data_series})
+    _island_evaluator = SwarmEvaluator(data_series)
+
+
+def _run_epoch(n_iterations, params, swarm_state):
+    optimizer = PSOOptimizer(_island_data, n_iterations=n_iterations, swarm_state=swarm_state,
+                             evaluator=_island_evaluator, **params)
+    return optimizer.swarm_state, optimizer.mape_per_iter, optimizer.stop_reason
+
+
+def convert_particle(particle, n_intervals, Dmin, Dmax):
+    # Migran dari pulau dengan jumlah interval berbeda: batas interior diinterpolasi
+    # pada posisi relatif yang sama di [Dmin, Dmax]; z1 dan z2 tetap
+    points = np.concatenate(([Dmin], particle[2:], [Dmax]))
+    source = np.linspace(0, 1, len(points))
+    target = np.linspace(0, 1, n_intervals + 1)[1:-1]
+    return np.concatenate((particle[:2], np.interp(target, source, points)))
+
+
+class IslandPSO:
+    # Beberapa swarm (pulau) berjalan paralel, masing-masing dengan jumlah interval dan seed sendiri.
+    # Setiap migration_interval iterasi, partikel terbaik tiap pulau dikirim ke pulau berikutnya (ring)
+    # menggantikan partikel terburuknya.
+    def __init__(self, data, n_particles, n_iterations, w, c1, c2, n_islands=4, interval_counts=None,
+                 migration_interval=10, n_migrants=1, seed=None, executor="process", n_workers=None,
+                 **pso_kwargs):
+        self.data = data
+        self.data_series = np.asarray(data['Kurs Jual'].values, dtype=float)
+        self.n_iterations = n_iterations
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.executor = executor
+        self.n_workers = n_workers
+        self.Dmin = np.min(self.data_series)
+        self.Dmax = np.max(self.data_series)
+
+        if interval_counts is None:
+            interval_counts = np.linspace(5, 15, n_islands).round().astype(int)
+        self.interval_counts = [int(k) for k in interval_counts]
+        self.n_islands = len(self.interval_counts)
+        self.seeds = spawn_seeds(self.n_islands) if seed is None else [seed + i for i in range(self.n_islands)]
+        self.params = [
+            dict(n_particles=n_particles, w=w, c1=c1, c2=c2, seed=island_seed, n_intervals=k, **pso_kwargs)
+            for k, island_seed in zip(self.interval_counts, self.seeds)
+        ]
+
+        self.states = [None] * self.n_islands
+        self.histories = [[] for _ in range(self.n_islands)]
+        self.stop_reasons = ["max_iterations"] * self.n_islands
+        self.best_island = None
+        self.best = None
+        self.gbest = None
+        self.gbest_score = np.inf
+
+        self.run()
+
+    def run(self):
+        if self.executor == "process":
+            with ProcessPoolExecutor(max_workers=self.n_workers or self.n_islands, initializer=_init_island,
+                                     initargs=(self.data_series,)) as pool:
+                self.optimize(lambda *args: pool.map(_run_epoch, *args))
+        else:
+            _init_island(self.data_series)
+            self.optimize(lambda *args: map(_run_epoch, *args))
+
+    def optimize(self, map_epochs):
+        done = 0
+        while done < self.n_iterations:
+            # Pulau yang sudah berhenti (patience, target_mape, dsb.) tidak dijadwalkan lagi;
+            # penghitung patience dan waktu berjalan ikut tersimpan di swarm_state antar epoch
+            active = [i for i, reason in enumerate(self.stop_reasons) if reason == "max_iterations"]
+            if not active:
+                break
+            epoch = min(self.migration_interval, self.n_iterations - done)
+            results = list(map_epochs([epoch] * len(active), [self.params[i] for i in active],
+                                      [self.states[i] for i in active]))
+            for i, (state, history, stop_reason) in zip(active, results):
+                self.states[i] = state
+                self.histories[i].extend(history)
+                self.stop_reasons[i] = stop_reason
+            done += epoch
+            if done < self.n_iterations and self.n_islands > 1:
+                self.migrate()
+
+        scores = [state["gbest_score"] for state in self.states]
+        self.best_island = int(np.argmin(scores))
+        # Run 0 iterasi dari state pulau terbaik: menghasilkan interval, prediksi dan model seperti PSOOptimizer biasa
+        params = dict(self.params[self.best_island], verbose=False, callbacks=None)
+        self.best = PSOOptimizer(self.data, n_iterations=0, swarm_state=self.states[self.best_island], **params)
+        self.gbest = self.best.gbest
+        self.gbest_score = self.best.gbest_score
+
+    def migrate(self):
+        migrants = []
+        for state in self.states:
+            order = np.argsort(state["pbest_scores"])[:self.n_migrants]
+            migrants.append(state["pbest"][order])
+
+        for i, state in enumerate(self.states):
+            # Pulau yang sudah berhenti tetap mengirim migran, tetapi tidak menerima
+            if self.stop_reasons[i] != "max_iterations":
+                continue
+            incoming = migrants[i - 1]
+            worst = np.argsort(state["pbest_scores"])[::-1][:len(incoming)]
+            for slot, particle in zip(worst, incoming):
+                particle = convert_particle(particle, self.interval_counts[i], self.Dmin, self.Dmax)
+                state["particles"][slot] = particle
+                state["velocities"][slot] = 0
+                state["pbest"][slot] = particle
+                # Dinilai ulang di iterasi berikutnya pada pulau penerima
+                state["pbest_scores"][slot] = np.inf
+
+    def get_island_dataframe(self):
+        return pd.DataFrame({
+            "Pulau": np.arange(1, self.n_islands + 1),
+            "Seed": self.seeds,
+            "Jumlah Interval": self.interval_counts,
+            "MAPE Terbaik": [state["gbest_score"] for state in self.states],
+            "Iterasi": [len(history) for history in self.histories],
+            "Alasan Berhenti": self.stop_reasons,
+        })
+
+    def get_history_dataframe(self):
+        # Pulau yang berhenti lebih awal punya riwayat lebih pendek
+        return pd.DataFrame({f"Pulau {i + 1}": pd.Series(history, dtype=float) for i, history in enumerate(self.histories)})
+
+    def to_model(self):
+        return self.best.to_model()
@@ -0,0 +1,113 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from pso_callbacks import PSOCallback
+
+ACTIVE = ("antri", "berjalan")
+
+
+class Job:
+    def __init__(self, job_id, owner, params, context=None):
+        self.id = job_id
+        self.owner = owner
+        self.params = params
+        # Data pendukung untuk memulihkan tampilan (mis. setelah browser di-refresh)
+        self.context = context or {}
+        self.status = "antri"
+        self.progress = []  # MAPE gbest per iterasi
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self.cancel_event = threading.Event()
+        self.future = None
+
+    @property
+    def active(self):
+        return self.status in ACTIVE
+
+    @property
+    def n_iterations(self):
+        return self.params.get("n_iterations") or 0
+
+
+class JobProgress(PSOCallback):
+    # Meneruskan gbest per iterasi ke Job; mengembalikan True (berhenti) jika job dibatalkan
+    def __init__(self, job):
+        self.job = job
+
+    def on_iteration(self, optimizer, event):
+        self.job.progress.append(event["gbest_score"])
+        return self.job.cancel_event.is_set()
+
+
+class JobManager:
+    # Pool worker terbatas yang dibagi semua sesi; tiap sesi dibatasi jumlah job aktifnya
+    # agar satu analis tidak memenuhi antrean
+    def __init__(self, max_workers=2, max_active_per_owner=1, max_finished=50):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pso-job")
+        self.max_active_per_owner = max_active_per_owner
+        self.max_finished = max_finished
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, owner, params, compute, on_done=None, context=None):
+        # compute(callbacks) menjalankan optimasi dan mengembalikan hasilnya
+        with self.lock:
+            active = sum(1 for job in self.jobs.values() if job.owner == owner and job.active)
+            if active >= self.max_active_per_owner:
+                raise RuntimeError("Masih ada job yang berjalan untuk sesi ini. Tunggu atau batalkan dulu.")
+            job = Job(uuid.uuid4().hex[:12], owner, params, context)
+            self.jobs[job.id] = job
+            self.prune()
+        job.future = self.pool.submit(self.execute, job, compute, on_done)
+        return job
+
+    def execute(self, job, compute, on_done):
+        if job.cancel_event.is_set():
+            self.finish(job, "dibatalkan")
+            return
+        job.status = "berjalan"
+        try:
+            result = compute([JobProgress(job)])
+        except Exception as exc:
+            job.error = str(exc)
+            self.finish(job, "gagal")
+            return
+        # Optimasi yang dihentikan lewat callback tetap mengembalikan hasil; hasil itu dibuang
+        if job.cancel_event.is_set():
+            self.finish(job, "dibatalkan")
+            return
+        job.result = result
+        if on_done is not None:
+            on_done(result)
+        self.finish(job, "selesai")
+
+    def finish(self, job, status):
+        job.finished = time.time()
+        job.status = status
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is None or not job.active:
+            return False
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self.finish(job, "dibatalkan")
+        return True
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def jobs_for(self, owner):
+        with self.lock:
+            return [job for job in self.jobs.values() if job.owner == owner]
+
+    def prune(self):
+        finished = [job_id for job_id, job in self.jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
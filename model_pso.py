@@ -1,21 +1,237 @@
+import time
+from contextlib import contextmanager
+
 import numpy as np
 import pandas as pd
 
+from fts_model import FTSLeeModel, series_fingerprint, state_predictions_from_counts
+from pso_callbacks import PrintProgress
+from result_cache import ResultCache
+from swarm_parallel import SwarmExecutor
+from transition_index import TransitionIndex
+
+
+def spawn_seeds(n):
+    # Seed terpisah untuk run paralel tanpa seed: worker hasil fork mewarisi state np.random yang sama
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence().spawn(n)]
+
+
+class SwarmEvaluator:
+    # Menilai seluruh swarm sekaligus: fuzzifikasi, FLRG dan defuzzifikasi Lee
+    # dikerjakan sebagai operasi array berukuran (n_particles x n_data)
+    def __init__(self, data_series, max_cells=4_000_000):
+        self.data_series = np.asarray(data_series, dtype=float)
+        self.n = len(self.data_series)
+        self.Dmin = np.min(self.data_series)
+        self.Dmax = np.max(self.data_series)
+        self.max_cells = max_cells
+
+        self.sort_idx = np.argsort(self.data_series, kind="stable")
+        self.sorted_data = self.data_series[self.sort_idx]
+        self.rank = np.empty(self.n, dtype=np.intp)
+        self.rank[self.sort_idx] = np.arange(self.n)
+        # Prefix sum 1/a atas data terurut untuk menjumlahkan |a - q| / a per himpunan
+        self.inv_cumsum = np.concatenate(([0.0], np.cumsum(1 / self.sorted_data)))
+        # Dibangun saat pertama kali dipakai: O(n log n) waktu dan memori, tidak perlu untuk deret pendek
+        self._transition_index = None
+
+    def build_index(self):
+        if self._transition_index is None:
+            self._transition_index = TransitionIndex.build(self.rank)
+        return self._transition_index
+
+    def uses_index(self, n_columns):
+        # Partikel dengan n_columns kolom (z1, z2, k-1 batas) dijawab lewat indeks, bukan pemindaian
+        n_levels = max(int(self.n - 1).bit_length(), 1)
+        return self.n >= 4 * n_columns ** 2 * n_levels
+
+    def shared_arrays(self):
+        arrays = {
+            "data_series": self.data_series,
+            "sort_idx": self.sort_idx,
+            "sorted_data": self.sorted_data,
+            "rank": self.rank,
+            "inv_cumsum": self.inv_cumsum,
+        }
+        # Indeks hanya ikut dibagi jika sudah dibangun; worker lain membangunnya sendiri bila perlu
+        if self._transition_index is not None:
+            arrays["pair_xs"] = self._transition_index.xs
+            arrays["pair_levels"] = self._transition_index.levels
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, max_cells=4_000_000):
+        # Membangun evaluator dari array yang sudah dihitung (mis. di shared memory) tanpa sort ulang
+        evaluator = cls.__new__(cls)
+        arrays = dict(arrays)
+        pair_xs, pair_levels = arrays.pop("pair_xs", None), arrays.pop("pair_levels", None)
+        for name, array in arrays.items():
+            setattr(evaluator, name, array)
+        evaluator.n = len(evaluator.data_series)
+        evaluator._transition_index = None if pair_xs is None else TransitionIndex(pair_xs, pair_levels, evaluator.n)
+        evaluator.Dmin = evaluator.sorted_data[0]
+        evaluator.Dmax = evaluator.sorted_data[-1]
+        evaluator.max_cells = max_cells
+        return evaluator
+
+    def particles_to_intervals(self, particles):
+        particles = np.atleast_2d(particles)
+        return np.column_stack((self.Dmin - particles[:, 0], particles[:, 2:], self.Dmax + particles[:, 1]))
+
+    def fuzzify_swarm(self, intervals):
+        # Indeks himpunan = batas terakhir yang <= nilai data (nilai tepat di batas
+        # masuk ke interval atas, sama seperti PSOOptimizer.fuzzify_series)
+        n_rows, n_bounds = intervals.shape
+        n_states = n_bounds - 1
+        positions = np.searchsorted(self.sorted_data, intervals, side="left")
+        offsets = np.arange(n_rows)[:, None] * (self.n + 1)
+        markers = np.bincount((positions + offsets).ravel(), minlength=n_rows * (self.n + 1))
+        markers = markers.reshape(n_rows, self.n + 1)[:, :self.n]
+        fuzzy_sorted = np.cumsum(markers, axis=1, dtype=np.int16) - 1
+        np.clip(fuzzy_sorted, 0, n_states - 1, out=fuzzy_sorted)
+        return fuzzy_sorted[:, self.rank]
+
+    def count_transitions(self, fuzzified, n_states):
+        n_rows = fuzzified.shape[0]
+        offsets = np.arange(n_rows)[:, None] * (n_states * n_states)
+        codes = fuzzified[:, :-1].astype(np.intp) * n_states + fuzzified[:, 1:] + offsets
+        counts = np.bincount(codes.ravel(), minlength=n_rows * n_states * n_states)
+        return counts.reshape(n_rows, n_states, n_states)
+
+    def defuzzify_swarm(self, fuzzified, counts, fuzzy_classes):
+        state_pred = state_predictions_from_counts(counts, fuzzy_classes)
+        return np.take_along_axis(state_pred, fuzzified.astype(np.intp), axis=1)
+
+    def boundary_positions(self, particles):
+        # Posisi batas interval dalam data terurut: dua partikel dengan posisi yang sama
+        # menghasilkan fuzzifikasi (dan matriks FLRG) yang sama persis
+        intervals = self.particles_to_intervals(particles)
+        return np.searchsorted(self.sorted_data, intervals[:, 1:-1], side="left")
+
+    def transition_counts(self, particles):
+        # Dijawab dari TransitionIndex dalam O(k^2 log^2 n), tanpa fuzzifikasi seluruh data;
+        # untuk deret pendek pemindaian biasa masih lebih murah
+        particles = np.atleast_2d(particles)
+        if not self.uses_index(particles.shape[1]):
+            return self.scan_transition_counts(particles)
+        return self.build_index().count_matrix(self.boundary_positions(particles))
+
+    def scan_transition_counts(self, particles):
+        particles = np.atleast_2d(particles)
+        n_states = particles.shape[1] - 1
+        chunk = max(1, self.max_cells // max(self.n, 1))
+        counts = np.empty((len(particles), n_states, n_states), dtype=np.int32)
+        for start in range(0, len(particles), chunk):
+            intervals = self.particles_to_intervals(particles[start:start + chunk])
+            fuzzified = self.fuzzify_swarm(intervals)
+            counts[start:start + chunk] = self.count_transitions(fuzzified, n_states)
+        return counts
+
+    def mape_from_counts(self, particles, positions, counts):
+        # MAPE tanpa memindai seluruh data: setiap himpunan menempati rentang [start, end)
+        # pada data terurut, dan prediksinya q konstan di rentang itu
+        intervals = self.particles_to_intervals(particles)
+        fuzzy_classes = (intervals[:, :-1] + intervals[:, 1:]) / 2
+        n_rows = len(particles)
+        starts = np.column_stack((np.zeros(n_rows, dtype=np.intp), positions))
+        ends = np.column_stack((positions, np.full(n_rows, self.n, dtype=np.intp)))
+        state_pred = state_predictions_from_counts(counts, fuzzy_classes)
+
+        split = np.clip(np.searchsorted(self.sorted_data, state_pred, side="left"), starts, ends)
+        R = self.inv_cumsum
+        below = state_pred * (R[split] - R[starts]) - (split - starts)
+        above = (ends - split) - state_pred * (R[ends] - R[split])
+        ape_sum = np.where(ends > starts, below + above, 0.0).sum(axis=1)
+
+        # Lewati nilai pertama, sama seperti jalur per partikel
+        first_state = (positions <= self.rank[0]).sum(axis=1)
+        first_pred = state_pred[np.arange(n_rows), first_state]
+        first_ape = np.abs(self.data_series[0] - first_pred) / self.data_series[0]
+        return (ape_sum - first_ape) / (self.n - 1) * 100
+
+    def evaluate(self, particles, timings=None):
+        particles = np.atleast_2d(particles)
+        chunk = max(1, self.max_cells // max(self.n, 1))
+        scores = np.empty(len(particles))
+        for start in range(0, len(particles), chunk):
+            scores[start:start + chunk] = self._evaluate_chunk(particles[start:start + chunk], timings)
+        return scores
+
+    def _evaluate_chunk(self, particles, timings=None):
+        t0 = time.perf_counter()
+        intervals = self.particles_to_intervals(particles)
+        n_states = intervals.shape[1] - 1
+        fuzzy_classes = (intervals[:, :-1] + intervals[:, 1:]) / 2
+        fuzzified = self.fuzzify_swarm(intervals)
+        t1 = time.perf_counter()
+        counts = self.count_transitions(fuzzified, n_states)
+        t2 = time.perf_counter()
+        predictions = self.defuzzify_swarm(fuzzified, counts, fuzzy_classes)
+
+        # Lewati nilai pertama, sama seperti jalur per partikel
+        actual = self.data_series[1:]
+        scores = np.mean(np.abs((actual - predictions[:, 1:]) / actual), axis=1) * 100
+        if timings is not None:
+            for phase, seconds in (("fuzzify", t1 - t0), ("flrg", t2 - t1), ("defuzzify", time.perf_counter() - t2)):
+                timings[phase] = timings.get(phase, 0.0) + seconds
+        return scores
+
+
 class PSOOptimizer:
-    def __init__(self, data, n_particles, n_iterations, w, c1, c2):
+    def __init__(self, data, n_particles, n_iterations, w, c1, c2, batched=True,
+                 executor="serial", n_workers=None, seed=None, verbose=False, cache_size=4096,
+                 n_intervals=None, warm_start=None, patience=None, min_delta=0.0,
+                 diversity_tol=None, time_budget=None, target_mape=None, callbacks=None,
+                 swarm_state=None, evaluator=None):
         self.data_series = np.asarray(data['Kurs Jual'].values, dtype=float)
         self.n_particles = n_particles
         self.n_iterations = n_iterations
         self.w = w
         self.c1 = c1
         self.c2 = c2
+        self.batched = batched
+        self.executor = executor
+        self.n_workers = n_workers
+        self.seed = seed
+        self.verbose = verbose
+        # Progres dilaporkan lewat callback; print per iterasi hanya jika verbose=True
+        self.callbacks = list(callbacks or [])
+        if verbose:
+            self.callbacks.append(PrintProgress())
+        self.iter_timings = {}
+        self.n_evaluations = 0
+        self.rng = np.random if seed is None else np.random.RandomState(seed)
+        self.pool = None
+        # Cache LRU matriks FLRG, dikunci dengan posisi batas interval dalam data terurut
+        self.cache = ResultCache(cache_size, lock=False) if batched and cache_size else None
+
+        # Kriteria berhenti lebih awal (None = tidak dipakai)
+        self.patience = patience
+        self.min_delta = min_delta
+        self.diversity_tol = diversity_tol
+        self.time_budget = time_budget
+        self.target_mape = target_mape
+        self.stop_reason = None
+        self.iterations_run = 0
 
         self.Dmin = np.min(self.data_series)
         self.Dmax = np.max(self.data_series)
         self.range_data = self.Dmax - self.Dmin
         self.set_z_ranges()
+        # Evaluator boleh dipakai bersama antar run pada deret yang sama (mis. per proses worker)
+        self.evaluator = evaluator if evaluator is not None else SwarmEvaluator(self.data_series)
 
-        self.n_intervals = np.random.randint(5, 16)
+        # swarm_state: lanjutkan swarm dari run sebelumnya (posisi, kecepatan, pbest, gbest)
+        self.swarm_state = swarm_state
+        self.warm_start = None if warm_start is None else np.asarray(warm_start, dtype=float)
+        if swarm_state is not None:
+            self.n_intervals = swarm_state["particles"].shape[1] - 1
+        elif self.warm_start is not None:
+            self.n_intervals = len(self.warm_start) - 1
+        elif n_intervals is not None:
+            self.n_intervals = n_intervals
+        else:
+            self.n_intervals = self.rng.randint(5, 16)
         self.gbest = None
         self.gbest_score = np.inf
         self.mape_per_iter = []
@@ -57,14 +273,9 @@ class PSOOptimizer:
         return flrg
 
     def defuzzify(self, fuzzified, flrg, reps):
-        pred = []
-        for f in fuzzified:
-            next_states = flrg.get(f, [])
-            if next_states:
-                pred.append(np.mean([reps[s] for s in next_states]))
-            else:
-                pred.append(np.nan)
-        return np.array(pred)
+        # Rata-rata FLRG cukup dihitung sekali per himpunan, bukan per titik data
+        state_pred = {f: np.mean([reps[s] for s in next_states]) for f, next_states in flrg.items() if next_states}
+        return np.array([state_pred.get(f, np.nan) for f in fuzzified])
 
     def run_fts_lee(self, intervals):
         fuzzy_classes = self.get_fuzzy_classes(intervals)
@@ -73,33 +284,163 @@ class PSOOptimizer:
         pred = self.defuzzify(fuzzified, flrg, fuzzy_classes)
         return pred  # kembalikan semua prediksi, termasuk NaN
 
+    def evaluate_particle(self, particle):
+        full_intervals = self.generate_intervals(particle[0], particle[1], particle[2:])
+        predictions = self.run_fts_lee(full_intervals)
+
+        # Lewati nilai pertama karena prediksi pertama adalah NaN
+        actual = self.data_series[1:len(predictions)]
+        return self.calculate_mape(actual, predictions[1:])
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.iter_timings[name] = self.iter_timings.get(name, 0.0) + time.perf_counter() - start
+
+    def evaluate_swarm(self, particles):
+        self.n_evaluations += len(particles)
+        if not self.batched:
+            with self.phase("evaluate"):
+                return np.array([self.evaluate_particle(particle) for particle in particles])
+        if self.cache is not None:
+            return self.evaluate_cached(particles)
+        if self.pool is not None and self.pool.is_parallel:
+            # Rincian fase terjadi di worker; yang terukur hanya totalnya
+            with self.phase("evaluate"):
+                return self.pool.map("evaluate", particles)
+        return self.evaluator.evaluate(particles, timings=self.iter_timings)
+
+    def call_evaluator(self, method, particles):
+        if self.pool is not None:
+            return self.pool.map(method, particles)
+        return getattr(self.evaluator, method)(particles)
+
+    def evaluate_cached(self, particles):
+        n_states = particles.shape[1] - 1
+        counts = np.empty((len(particles), n_states, n_states), dtype=np.int32)
+        pending = {}
+        with self.phase("fuzzify"):
+            positions = self.evaluator.boundary_positions(particles)
+            for i, row in enumerate(positions):
+                key = row.tobytes()
+                cached = self.cache.get(key)
+                if cached is None:
+                    pending.setdefault(key, []).append(i)
+                else:
+                    counts[i] = cached
+
+        if pending:
+            with self.phase("flrg"):
+                first = [indices[0] for indices in pending.values()]
+                computed = self.call_evaluator("transition_counts", particles[first])
+                for (key, indices), value in zip(pending.items(), computed):
+                    self.cache.put(key, value)
+                    counts[indices] = value
+
+        with self.phase("defuzzify"):
+            return self.evaluator.mape_from_counts(particles, positions, counts)
+
+    def cache_info(self):
+        return self.cache.info() if self.cache is not None else None
+
     def initialize_particles(self):
+        if self.warm_start is not None:
+            return self.initialize_around(self.warm_start)
         particles = []
         for _ in range(self.n_particles):
-            z1 = np.random.uniform(*self.z1_range)
-            z2 = np.random.uniform(*self.z2_range)
-            interval_points = np.sort(np.random.uniform(self.Dmin, self.Dmax, self.n_intervals - 1))
+            z1 = self.rng.uniform(*self.z1_range)
+            z2 = self.rng.uniform(*self.z2_range)
+            interval_points = np.sort(self.rng.uniform(self.Dmin, self.Dmax, self.n_intervals - 1))
             particle = np.concatenate(([z1, z2], interval_points))
             particles.append(particle)
         return np.array(particles)
 
+    def initialize_around(self, center, spread=0.05):
+        # Warm start: partikel pertama = gbest sebelumnya, sisanya tersebar di sekitarnya
+        particles = np.tile(center, (self.n_particles, 1))
+        z_width = self.z1_range[1] - self.z1_range[0]
+        particles[1:, 0:2] += self.rng.normal(0, spread * z_width, (self.n_particles - 1, 2))
+        particles[1:, 2:] += self.rng.normal(0, spread * self.range_data, (self.n_particles - 1, self.n_intervals - 1))
+        particles[:, 0:2] = np.clip(particles[:, 0:2], self.z1_range[0], self.z1_range[1])
+        particles[:, 2:] = np.sort(np.clip(particles[:, 2:], self.Dmin, self.Dmax), axis=1)
+        return particles
+
     def run(self):
-        particles = self.initialize_particles()
-        velocities = np.zeros_like(particles)
-        pbest = particles.copy()
-        pbest_scores = np.full(self.n_particles, np.inf)
+        # Bangun indeks transisi sebelum disalin ke shared memory, agar tiap worker tidak membangunnya sendiri
+        uses_index = self.cache is not None and self.n_iterations > 0 and self.evaluator.uses_index(self.n_intervals + 1)
+        if self.executor == "process" and uses_index:
+            self.evaluator.build_index()
+        with SwarmExecutor(self.evaluator, self.executor, self.n_workers) as pool:
+            self.pool = pool
+            try:
+                self.optimize()
+            finally:
+                self.pool = None
 
-        for iter_num in range(self.n_iterations):
-            for i in range(self.n_particles):
-                z1, z2 = particles[i, 0], particles[i, 1]
-                interval_points = particles[i, 2:]
-                full_intervals = self.generate_intervals(z1, z2, interval_points)
-                predictions = self.run_fts_lee(full_intervals)
+    def swarm_diversity(self, particles):
+        # Rata-rata jarak partikel ke pusat swarm, dinormalisasi dengan rentang data
+        centroid = particles.mean(axis=0)
+        return np.mean(np.linalg.norm(particles - centroid, axis=1)) / max(self.range_data, 1e-12)
+
+    def check_stopping(self, particles, start_time, stale_iters):
+        if self.target_mape is not None and self.gbest_score <= self.target_mape:
+            return "target_mape"
+        if self.patience is not None and stale_iters >= self.patience:
+            return "patience"
+        if self.diversity_tol is not None and self.swarm_diversity(particles) < self.diversity_tol:
+            return "diversity"
+        if self.time_budget is not None and time.perf_counter() - start_time >= self.time_budget:
+            return "time_budget"
+        return None
 
-                # Lewati nilai pertama karena prediksi pertama adalah NaN
-                actual = self.data_series[1:len(predictions)]
-                mape = self.calculate_mape(actual, predictions[1:])
+    def notify_iteration(self, iter_num, diversity, start_time):
+        event = {
+            "iteration": iter_num + 1,
+            "n_iterations": self.n_iterations,
+            "gbest_score": self.gbest_score,
+            "gbest": self.gbest.copy(),
+            "diversity": diversity,
+            "n_evaluations": self.n_evaluations,
+            "timings": dict(self.iter_timings),
+            "elapsed": time.perf_counter() - start_time,
+        }
+        stop = False
+        for callback in self.callbacks:
+            stop = bool(callback.on_iteration(self, event)) or stop
+        return stop
 
+    def optimize(self):
+        start_time = time.perf_counter()
+        for callback in self.callbacks:
+            callback.on_start(self)
+        if self.swarm_state is not None:
+            particles = self.swarm_state["particles"].copy()
+            velocities = self.swarm_state["velocities"].copy()
+            pbest = self.swarm_state["pbest"].copy()
+            pbest_scores = self.swarm_state["pbest_scores"].copy()
+            self.gbest = self.swarm_state["gbest"].copy()
+            self.gbest_score = self.swarm_state["gbest_score"]
+            if self.seed is not None and "rng_state" in self.swarm_state:
+                self.rng.set_state(self.swarm_state["rng_state"])
+            # patience dan time_budget dihitung sejak awal swarm, bukan sejak lanjutan ini
+            stale_iters = self.swarm_state.get("stale_iters", 0)
+            start_time -= self.swarm_state.get("elapsed", 0.0)
+        else:
+            particles = self.initialize_particles()
+            velocities = np.zeros_like(particles)
+            pbest = particles.copy()
+            pbest_scores = np.full(self.n_particles, np.inf)
+            stale_iters = 0
+        self.stop_reason = "max_iterations"
+
+        for iter_num in range(self.n_iterations):
+            self.iter_timings = {}
+            previous_best = self.gbest_score
+            scores = self.evaluate_swarm(particles)
+            for i, mape in enumerate(scores):
                 if mape < pbest_scores[i]:
                     pbest_scores[i] = mape
                     pbest[i] = particles[i].copy()
@@ -108,26 +449,75 @@ class PSOOptimizer:
                     self.gbest = particles[i].copy()
 
             self.mape_per_iter.append(self.gbest_score)
+            self.iterations_run = iter_num + 1
+            stale_iters = 0 if previous_best - self.gbest_score > self.min_delta else stale_iters + 1
 
-            print(f"[Iter {iter_num + 1:03d}] MAPE = {self.gbest_score:.4f}% | z1 = {self.gbest[0]:.2f}, z2 = {self.gbest[1]:.2f}, intervals = {len(self.gbest[2:]) + 1}")
+            reason = self.check_stopping(particles, start_time, stale_iters)
+            diversity = self.swarm_diversity(particles)
+            if reason is None:
+                with self.phase("update"):
+                    r1, r2 = self.rng.rand(self.n_particles, particles.shape[1]), self.rng.rand(self.n_particles, particles.shape[1])
+                    velocities = (
+                        self.w * velocities
+                        + self.c1 * r1 * (pbest - particles)
+                        + self.c2 * r2 * (self.gbest - particles)
+                    )
+                    particles += velocities
+                    particles[:, 0:2] = np.clip(particles[:, 0:2], self.z1_range[0], self.z1_range[1])
+                    particles[:, 2:] = np.clip(particles[:, 2:], self.Dmin, self.Dmax)
+                    particles[:, 2:] = np.sort(particles[:, 2:], axis=1)
 
-            r1, r2 = np.random.rand(self.n_particles, particles.shape[1]), np.random.rand(self.n_particles, particles.shape[1])
-            velocities = (
-                self.w * velocities
-                + self.c1 * r1 * (pbest - particles)
-                + self.c2 * r2 * (self.gbest - particles)
-            )
-            particles += velocities
-            particles[:, 0:2] = np.clip(particles[:, 0:2], self.z1_range[0], self.z1_range[1])
-            particles[:, 2:] = np.clip(particles[:, 2:], self.Dmin, self.Dmax)
-            for i in range(self.n_particles):
-                particles[i, 2:] = np.sort(particles[i, 2:])
+            if self.notify_iteration(iter_num, diversity, start_time) and reason is None:
+                reason = "callback"
+            if reason is not None:
+                self.stop_reason = reason
+                break
 
+        self.swarm_state = {
+            "particles": particles,
+            "velocities": velocities,
+            "pbest": pbest,
+            "pbest_scores": pbest_scores,
+            "gbest": self.gbest.copy(),
+            "gbest_score": self.gbest_score,
+            "stale_iters": stale_iters,
+            "elapsed": time.perf_counter() - start_time,
+        }
+        if self.seed is not None:
+            # Lanjutan dengan seed yang sama meneruskan urutan acak, jadi 2 x 5 iterasi = 10 iterasi
+            self.swarm_state["rng_state"] = self.rng.get_state()
         self.z1_best, self.z2_best = self.gbest[0], self.gbest[1]
         self.best_intervals = self.generate_intervals(self.z1_best, self.z2_best, self.gbest[2:])
         self.prediksi = self.run_fts_lee(self.best_intervals)
         self.aktual = self.data_series[:len(self.prediksi)]  # tetap simpan panjang yang sama
 
+        for callback in self.callbacks:
+            callback.on_end(self)
+
+    def to_model(self):
+        counts = self.evaluator.transition_counts(self.gbest[None, :])[0]
+        fuzzified = self.fuzzify_series(self.data_series[-1:], self.best_intervals)
+        return FTSLeeModel(
+            self.best_intervals,
+            self.get_fuzzy_classes(self.best_intervals),
+            counts,
+            last_state=fuzzified[-1],
+            n_data=len(self.data_series),
+            mape=self.gbest_score,
+            z1=self.z1_best,
+            z2=self.z2_best,
+            seed=self.seed,
+            fingerprint=series_fingerprint(self.data_series),
+        )
+
+    def refine(self, data, n_iterations=10, **kwargs):
+        # Optimasi singkat pada data terbaru, dimulai dari gbest run ini
+        options = dict(seed=self.seed, verbose=self.verbose, executor=self.executor, n_workers=self.n_workers,
+                       callbacks=[callback for callback in self.callbacks if not isinstance(callback, PrintProgress)])
+        options.update(kwargs)
+        return PSOOptimizer(data, self.n_particles, n_iterations, self.w, self.c1, self.c2,
+                            batched=self.batched, warm_start=self.gbest, **options)
+
     def get_result_dataframe(self):
         return pd.DataFrame({
             "No": range(1, len(self.prediksi) + 1),
@@ -0,0 +1,335 @@
+import argparse
+import glob
+import itertools
+import json
+import math
+import os
+import queue
+import re
+import socketserver
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from fts_model import FTSLeeModel
+
+MODEL_SUFFIX = ".ftsl"
+# Kode mata uang juga menjadi nama file artefak, jadi tidak boleh berisi pemisah path
+CURRENCY_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def fit_model_bytes(csv_path, params):
+    # Dijalankan di proses terpisah agar optimasi tidak menahan thread pembaca
+    from data_loader import load_kurs_csv
+    from model_pso import PSOOptimizer
+
+    data, _ = load_kurs_csv(csv_path, window=params.get("window"))
+    optimizer = PSOOptimizer(
+        data,
+        params.get("n_particles", 10),
+        params.get("n_iterations", 30),
+        w=params.get("w", 0.9),
+        c1=params.get("c1", 1.5),
+        c2=params.get("c2", 1.5),
+        seed=params.get("seed"),
+        verbose=False,
+    )
+    return optimizer.to_model().to_bytes()
+
+
+class ModelRegistry:
+    # Model per mata uang; pergantian model hanya mengganti referensi, pembaca tidak pernah menunggu refit
+    def __init__(self, models=None):
+        self.models = dict(models or {})
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_dir(cls, model_dir):
+        models = {}
+        for path in sorted(glob.glob(os.path.join(model_dir, "*" + MODEL_SUFFIX))):
+            currency = os.path.basename(path)[:-len(MODEL_SUFFIX)]
+            models[currency] = FTSLeeModel.load(path)
+        return cls(models)
+
+    def get(self, currency):
+        return self.models.get(currency)
+
+    def set(self, currency, model):
+        with self.lock:
+            models = dict(self.models)
+            models[currency] = model
+            self.models = models
+
+    def currencies(self):
+        return sorted(self.models)
+
+
+class PredictionBatcher:
+    # Permintaan yang datang bersamaan untuk satu mata uang digabung menjadi satu panggilan predict()
+    def __init__(self, registry, max_batch=4096):
+        self.registry = registry
+        self.max_batch = max_batch
+        self.queues = {}
+        self.lock = threading.Lock()
+
+    def queue_for(self, currency):
+        with self.lock:
+            pending = self.queues.get(currency)
+            if pending is None:
+                pending = queue.Queue()
+                self.queues[currency] = pending
+                threading.Thread(target=self.worker, args=(currency, pending), daemon=True).start()
+            return pending
+
+    def worker(self, currency, pending):
+        while True:
+            batch = [pending.get()]
+            size = len(batch[0]["values"])
+            while size < self.max_batch:
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+                size += len(item["values"])
+
+            model = self.registry.get(currency)
+            try:
+                predictions = model.predict(np.concatenate([item["values"] for item in batch]))
+                offset = 0
+                for item in batch:
+                    item["result"] = predictions[offset:offset + len(item["values"])]
+                    offset += len(item["values"])
+            except Exception as exc:
+                for item in batch:
+                    item["error"] = exc
+            for item in batch:
+                item["done"].set()
+
+    def predict(self, currency, values):
+        if self.registry.get(currency) is None:
+            raise KeyError(currency)
+        item = {"values": np.asarray(values, dtype=float).ravel(), "done": threading.Event()}
+        self.queue_for(currency).put(item)
+        item["done"].wait()
+        if "error" in item:
+            raise item["error"]
+        return item["result"]
+
+
+class Refitter:
+    def __init__(self, registry, model_dir=None, max_workers=1):
+        self.registry = registry
+        self.model_dir = model_dir
+        self.pool = ProcessPoolExecutor(max_workers=max_workers)
+        self.jobs = {}
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def submit(self, currency, csv_path, params):
+        with self.lock:
+            job_id = str(next(self.ids))
+            self.jobs[job_id] = {"currency": currency, "status": "running"}
+        future = self.pool.submit(fit_model_bytes, csv_path, params)
+        future.add_done_callback(lambda f: self.finish(job_id, currency, f))
+        return job_id
+
+    def finish(self, job_id, currency, future):
+        try:
+            payload = future.result()
+            model = FTSLeeModel.from_bytes(payload)
+            if self.model_dir:
+                model.save(os.path.join(self.model_dir, currency + MODEL_SUFFIX))
+            self.registry.set(currency, model)
+            status = {"status": "done", "mape": model.mape}
+        except Exception as exc:
+            status = {"status": "failed", "error": str(exc)}
+        with self.lock:
+            self.jobs[job_id].update(status)
+
+    def status(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_rates(values):
+    if not isinstance(values, list):
+        raise ValueError("rates harus berupa daftar angka")
+    rates = []
+    for value in values:
+        # null, bool, objek, teks non-angka dan NaN/inf ditolak; NaN akan jatuh ke himpunan tepi saat di-clip
+        try:
+            if isinstance(value, bool) or value is None:
+                raise TypeError
+            rate = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"rate tidak valid: {value!r}") from None
+        if not math.isfinite(rate):
+            raise ValueError(f"rate harus bilangan berhingga: {value!r}")
+        rates.append(rate)
+    return rates
+
+
+def to_json_list(values):
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Header dan body dikirim terpisah; tanpa TCP_NODELAY, Nagle + delayed ACK menambah ~40 ms
+    disable_nagle_algorithm = True
+    service = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/health":
+            self.send_json(200, {"status": "ok", "currencies": self.service.registry.currencies()})
+        elif url.path == "/predict":
+            self.handle_predict(query.get("currency", [None])[0], query.get("rate", []))
+        elif url.path.startswith("/jobs/"):
+            job = self.service.refitter.status(url.path[len("/jobs/"):])
+            self.send_json(200 if job else 404, job or {"error": "job tidak ditemukan"})
+        else:
+            self.send_json(404, {"error": "endpoint tidak ditemukan"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        try:
+            body = self.read_json()
+        except ValueError:
+            self.send_json(400, {"error": "body harus JSON"})
+            return
+        if not isinstance(body, dict):
+            self.send_json(400, {"error": "body harus objek JSON"})
+            return
+        if url.path == "/predict":
+            rates = body.get("rates", [body["rate"]] if "rate" in body else [])
+            self.handle_predict(body.get("currency"), rates)
+        elif url.path == "/refit":
+            self.handle_refit(body)
+        else:
+            self.send_json(404, {"error": "endpoint tidak ditemukan"})
+
+    def handle_refit(self, body):
+        currency, params = body.get("currency"), body.get("params", {})
+        if not isinstance(currency, str) or not CURRENCY_PATTERN.match(currency):
+            self.send_json(400, {"error": "currency wajib diisi dan hanya boleh berisi huruf, angka, '_' atau '-'"})
+            return
+        csv_path = self.service.resolve_csv(body.get("csv"))
+        if csv_path is None:
+            self.send_json(400, {"error": "csv harus nama file yang ada di folder data server"})
+            return
+        if not isinstance(params, dict):
+            self.send_json(400, {"error": "params harus objek JSON"})
+            return
+        job_id = self.service.refitter.submit(currency, csv_path, params)
+        self.send_json(202, {"job": job_id, "status": "running"})
+
+    def handle_predict(self, currency, rates):
+        try:
+            rates = parse_rates(rates)
+        except ValueError as exc:
+            self.send_json(400, {"error": str(exc)})
+            return
+        if not rates:
+            self.send_json(400, {"error": "rate wajib diisi"})
+            return
+        try:
+            predictions = self.service.batcher.predict(currency, rates)
+        except KeyError:
+            self.send_json(404, {"error": f"model untuk {currency!r} tidak ada"})
+            return
+        except (TypeError, ValueError) as exc:
+            self.send_json(400, {"error": str(exc)})
+            return
+        self.send_json(200, {"currency": currency, "predictions": to_json_list(predictions)})
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler mengharapkan alamat berbentuk (host, port)
+        return request, ("unix", 0)
+
+
+class PredictionService:
+    def __init__(self, registry, model_dir=None, data_dir=".", max_batch=4096):
+        self.registry = registry
+        self.data_dir = data_dir
+        self.batcher = PredictionBatcher(registry, max_batch=max_batch)
+        self.refitter = Refitter(registry, model_dir=model_dir)
+
+    def resolve_csv(self, name):
+        # /refit hanya boleh membaca file di dalam data_dir
+        if not isinstance(name, str) or not name:
+            return None
+        root = os.path.realpath(self.data_dir)
+        path = os.path.realpath(os.path.join(root, name))
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            return None
+        return path
+
+    def create_server(self, host="127.0.0.1", port=0, unix_socket=None):
+        if unix_socket:
+            handler = type("BoundPredictionHandler", (PredictionHandler,), {"service": self, "disable_nagle_algorithm": False})
+            if os.path.exists(unix_socket):
+                os.unlink(unix_socket)
+            return ThreadingUnixHTTPServer(unix_socket, handler)
+        handler = type("BoundPredictionHandler", (PredictionHandler,), {"service": self})
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+        return server
+
+    def shutdown(self):
+        self.refitter.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan prediksi FTS Lee + PSO per mata uang.")
+    parser.add_argument("--model-dir", default="models", help="folder berisi artefak <kode>.ftsl")
+    parser.add_argument("--data-dir", default=".", help="folder CSV yang boleh dipakai /refit")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", default=None, help="dengarkan di Unix socket alih-alih TCP")
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry.from_dir(args.model_dir)
+    service = PredictionService(registry, model_dir=args.model_dir, data_dir=args.data_dir)
+    server = service.create_server(args.host, args.port, args.unix_socket)
+    print(f"Model dimuat: {', '.join(registry.currencies()) or '-'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
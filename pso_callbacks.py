@@ -0,0 +1,112 @@
+import cProfile
+import io
+import json
+import pstats
+import sys
+
+import numpy as np
+
+
+class PSOCallback:
+    # Observer untuk PSOOptimizer. on_iteration menerima event per iterasi
+    # (gbest, diversity, jumlah evaluasi, waktu per fase); return True untuk menghentikan optimasi.
+    def on_start(self, optimizer):
+        pass
+
+    def on_iteration(self, optimizer, event):
+        return None
+
+    def on_end(self, optimizer):
+        pass
+
+
+class PrintProgress(PSOCallback):
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def on_iteration(self, optimizer, event):
+        gbest = event["gbest"]
+        print(f"[Iter {event['iteration']:03d}] MAPE = {event['gbest_score']:.4f}% | z1 = {gbest[0]:.2f}, z2 = {gbest[1]:.2f}, intervals = {len(gbest[2:]) + 1}",
+              file=self.stream or sys.stdout)
+
+
+class TimingSummary(PSOCallback):
+    # Total waktu per fase untuk seluruh run; profile=True juga menjalankan cProfile
+    def __init__(self, profile=False):
+        self.profile = profile
+        self.profiler = None
+        self.totals = {}
+        self.iterations = 0
+        self.n_evaluations = 0
+        self.elapsed = 0.0
+
+    def on_start(self, optimizer):
+        if self.profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def on_iteration(self, optimizer, event):
+        for phase, seconds in event["timings"].items():
+            self.totals[phase] = self.totals.get(phase, 0.0) + seconds
+        self.iterations = event["iteration"]
+        self.n_evaluations = event["n_evaluations"]
+        self.elapsed = event["elapsed"]
+
+    def on_end(self, optimizer):
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def summary(self):
+        return {
+            "iterations": self.iterations,
+            "n_evaluations": self.n_evaluations,
+            "elapsed": self.elapsed,
+            "evals_per_sec": self.n_evaluations / self.elapsed if self.elapsed else np.nan,
+            "phases": dict(self.totals),
+        }
+
+    def report(self, top=20):
+        lines = [f"{phase:<10} {seconds * 1000:10.2f} ms" for phase, seconds in sorted(self.totals.items(), key=lambda item: -item[1])]
+        if self.profiler is not None:
+            buffer = io.StringIO()
+            pstats.Stats(self.profiler, stream=buffer).sort_stats("cumulative").print_stats(top)
+            lines.append(buffer.getvalue())
+        return "\n".join(lines)
+
+
+class JsonLogger(PSOCallback):
+    # Satu baris JSON per event (start, iteration, end) ke file atau stream
+    def __init__(self, target):
+        self.target = target
+        self.stream = None
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, default=float) + "\n")
+        self.stream.flush()
+
+    def on_start(self, optimizer):
+        self.stream = open(self.target, "a") if isinstance(self.target, str) else self.target
+        self.write({
+            "event": "start",
+            "n_particles": optimizer.n_particles,
+            "n_iterations": optimizer.n_iterations,
+            "n_intervals": int(optimizer.n_intervals),
+            "n_data": len(optimizer.data_series),
+            "seed": optimizer.seed,
+        })
+
+    def on_iteration(self, optimizer, event):
+        record = {"event": "iteration", **event}
+        record["gbest"] = np.asarray(event["gbest"]).tolist()
+        self.write(record)
+
+    def on_end(self, optimizer):
+        self.write({
+            "event": "end",
+            "gbest_score": optimizer.gbest_score,
+            "stop_reason": optimizer.stop_reason,
+            "iterations_run": optimizer.iterations_run,
+            "cache": optimizer.cache_info(),
+        })
+        if isinstance(self.target, str):
+            self.stream.close()
@@ -0,0 +1,70 @@
+import io
+
+import numpy as np
+from matplotlib.figure import Figure
+
+MAX_POINTS = 1500
+MARKER_LIMIT = 300  # marker per titik hanya untuk deret pendek
+
+
+def lttb_indices(x, y, n_out):
+    # Largest-Triangle-Three-Buckets: dari tiap bucket dipilih titik yang membentuk segitiga terbesar
+    # dengan titik terpilih sebelumnya dan rata-rata bucket berikutnya, sehingga puncak/lembah tetap terlihat
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def downsample(dates, values, n_out=MAX_POINTS):
+    dates = np.asarray(dates)
+    values = np.asarray(values, dtype=float)
+    # LTTB hanya memilih dari titik berhingga; NaN (prediksi pertama, himpunan tanpa FLRG) tidak ikut dipilih
+    finite = np.flatnonzero(np.isfinite(values))
+    x = dates[finite].astype("datetime64[ns]").astype(np.int64).astype(float) if np.issubdtype(dates.dtype, np.datetime64) else dates[finite].astype(float)
+    selected = finite[lttb_indices(x, values[finite], n_out)]
+
+    # Celah di tengah deret tetap diputus: NaN disisipkan di antara dua titik terpilih yang mengapit NaN
+    missing = np.flatnonzero(~np.isfinite(values))
+    gaps = np.flatnonzero(np.searchsorted(missing, selected[1:]) > np.searchsorted(missing, selected[:-1]))
+    positions = np.insert(selected, gaps + 1, missing[np.searchsorted(missing, selected[gaps])])
+    return dates[positions], values[positions]
+
+
+def render_line_chart(dates, lines, title, xlabel, ylabel, figsize=(8, 4), title_kwargs=None,
+                      label_kwargs=None, grid=False, max_points=MAX_POINTS):
+    # lines: daftar (nilai, label, style). Figure dibuat tanpa pyplot agar aman dipanggil dari thread mana pun
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    for values, label, style in lines:
+        style = dict(style)
+        if len(values) > MARKER_LIMIT:
+            style.pop("marker", None)
+        x, y = downsample(dates, values, max_points)
+        ax.plot(x, y, label=label, **style)
+    ax.set_title(title, **(title_kwargs or {}))
+    ax.set_xlabel(xlabel, **(label_kwargs or {}))
+    ax.set_ylabel(ylabel, **(label_kwargs or {}))
+    ax.legend()
+    if grid:
+        ax.grid(True)
+    fig.autofmt_xdate(rotation=45)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def page_count(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+
+
+def make_key(fingerprint, params):
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(f"{fingerprint}|{payload}".encode()).hexdigest()
+
+
+class ResultCache:
+    # Cache LRU, mis. hasil prediksi yang dibagi antar sesi (dikunci dengan sidik jari data + parameter)
+    # atau matriks FLRG di dalam satu run PSO. lock=False untuk cache yang hanya dipakai satu thread
+    def __init__(self, max_entries=32, lock=True):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock() if lock else nullcontext()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def info(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.entries),
+                    "max_entries": self.max_entries}
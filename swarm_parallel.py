@@ -0,0 +1,147 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_worker_arrays = None
+_worker_evaluator = None
+
+
+class SharedArrays:
+    # Menyalin array read-only ke shared memory sekali saja; worker cukup menempel lewat nama blok
+    def __init__(self, arrays):
+        self.blocks = []
+        self.specs = {}
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            self.blocks.append(block)
+            self.specs[name] = (block.name, array.shape, array.dtype.str)
+
+    @staticmethod
+    def attach(specs):
+        blocks, arrays = [], {}
+        for name, (block_name, shape, dtype) in specs.items():
+            # Worker berbagi resource tracker dengan proses utama, yang menghapus blok di close()
+            block = shared_memory.SharedMemory(name=block_name)
+            array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+            array.flags.writeable = False
+            blocks.append(block)
+            arrays[name] = array
+        return blocks, arrays
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+
+def _init_worker(evaluator_cls, specs):
+    global _worker_arrays, _worker_evaluator
+    _worker_arrays, arrays = SharedArrays.attach(specs)
+    _worker_evaluator = evaluator_cls.from_arrays(arrays)
+
+
+def _worker_call(method, particles):
+    return getattr(_worker_evaluator, method)(particles)
+
+
+class SharedPool:
+    # Pool proses yang worker-nya sudah menempel ke array evaluator di shared memory. Bisa diberikan
+    # sebagai executor ke beberapa PSOOptimizer sekaligus (mis. sweep k) pada deret yang sama.
+    def __init__(self, evaluator, n_workers=None):
+        self.evaluator = evaluator
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.shared = None
+        self.pool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self):
+        self.shared = SharedArrays(self.evaluator.shared_arrays())
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_worker,
+            initargs=(type(self.evaluator), self.shared.specs),
+        )
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+        if self.shared is not None:
+            self.shared.close()
+        self.pool = None
+        self.shared = None
+
+
+class SwarmExecutor:
+    # Membagi swarm menjadi potongan berurutan per worker; hasil digabung sesuai urutan partikel
+    # sehingga nilai yang sama keluar berapa pun jumlah worker-nya
+    def __init__(self, evaluator, executor="serial", n_workers=None):
+        self.evaluator = evaluator
+        self.executor = executor
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.pool = None
+        self.shared_pool = None
+        self.owns_pool = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self):
+        if isinstance(self.executor, SharedPool):
+            self.shared_pool = self.executor
+            self.n_workers = self.shared_pool.n_workers
+            self.pool = self.shared_pool.pool
+        elif isinstance(self.executor, Executor):
+            self.pool = self.executor
+        elif self.executor == "thread":
+            self.pool = ThreadPoolExecutor(max_workers=self.n_workers)
+            self.owns_pool = True
+        elif self.executor == "process":
+            self.shared_pool = SharedPool(self.evaluator, self.n_workers)
+            self.shared_pool.start()
+            self.pool = self.shared_pool.pool
+            self.owns_pool = True
+        elif self.executor != "serial":
+            raise ValueError(f"executor tidak dikenal: {self.executor!r}")
+
+    def close(self):
+        if self.owns_pool:
+            if self.shared_pool is not None:
+                self.shared_pool.close()
+            else:
+                self.pool.shutdown()
+        self.pool = None
+        self.shared_pool = None
+        self.owns_pool = False
+
+    @property
+    def is_parallel(self):
+        return self.pool is not None
+
+    def map(self, method, particles):
+        if self.pool is None or len(particles) < 2:
+            return getattr(self.evaluator, method)(particles)
+
+        chunks = [chunk for chunk in np.array_split(particles, self.n_workers) if len(chunk)]
+        if self.shared_pool is not None:
+            futures = [self.pool.submit(_worker_call, method, chunk) for chunk in chunks]
+        else:
+            futures = [self.pool.submit(getattr(self.evaluator, method), chunk) for chunk in chunks]
+        return np.concatenate([future.result() for future in futures])
+
+    def evaluate(self, particles):
+        return self.map("evaluate", particles)
@@ -0,0 +1,59 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_loader import load_kurs_csv
+from fts_manual import FTSLeeManual
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# MAPE dari implementasi per baris sebelum mesin array
+BUNDLED_MAPE = {
+    "Kurs Transaksi USD.csv": 0.32558161086009696,
+    "Kurs Transaksi GBP.csv": 0.2887732185659999,
+    "Kurs Transaksi JPY .csv": 0.3173504672053433,
+}
+
+
+def reference_prediksi(data_series, intervals):
+    # Alur per baris yang asli: interval pertama yang memuat nilai, FLR mulai data kedua,
+    # data terakhir berelasi ke dirinya sendiri, rata-rata FLRG dibulatkan 2 desimal (pembulatan numpy)
+    jumlah_himpunan = len(intervals) - 1
+    states = [next(i for i in range(jumlah_himpunan) if intervals[i] <= x <= intervals[i + 1]) for x in data_series]
+    flrg = {}
+    for i in range(1, len(states)):
+        next_state = states[i + 1] if i + 1 < len(states) else states[i]
+        flrg.setdefault(states[i], []).append(next_state)
+    width = (max(data_series) - min(data_series)) / jumlah_himpunan
+    lower = [min(data_series) + i * width for i in range(jumlah_himpunan)]
+    representasi = [np.round((a + (a + width)) / 2, 2) for a in lower]
+    return np.array([np.round(sum(representasi[s] for s in flrg[f]) / len(flrg[f]), 2) if f in flrg else np.nan
+                     for f in states])
+
+
+class FTSLeeManualTest(unittest.TestCase):
+    def test_bundled_csvs(self):
+        for name, mape in BUNDLED_MAPE.items():
+            with self.subTest(csv=name):
+                data = load_kurs_csv(os.path.join(BASE_DIR, name))[0]
+                model = FTSLeeManual(data)
+                self.assertEqual(model.mape, mape)
+                expected = reference_prediksi(model.data_series.tolist(), model.intervals.tolist())
+                np.testing.assert_array_equal(model.prediksi, expected)
+
+    def test_values_on_interval_bounds(self):
+        # N = 10 -> 4 himpunan, batas 950, 1050, 1150, 1250, 1350; nilai tepat di batas masuk ke interval bawah
+        data = pd.DataFrame({'Kurs Jual': [1000.0, 1050, 1150, 1100, 1250, 1300, 1150, 1050, 1200, 1250]})
+        model = FTSLeeManual(data)
+        np.testing.assert_array_equal(model.intervals, [950.0, 1050.0, 1150.0, 1250.0, 1350.0])
+        np.testing.assert_array_equal(model.fuzzified, [0, 0, 1, 1, 2, 3, 1, 0, 2, 2])
+        np.testing.assert_array_equal(model.prediksi, [1150.0, 1150.0, 1112.5, 1112.5, 1212.5, 1112.5, 1112.5,
+                                                       1150.0, 1212.5, 1212.5])
+        self.assertEqual(model.mape, 5.352273933795673)
+        np.testing.assert_array_equal(model.prediksi,
+                                      reference_prediksi(model.data_series.tolist(), model.intervals.tolist()))
+
+
+if __name__ == "__main__":
+    unittest.main()
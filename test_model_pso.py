@@ -0,0 +1,59 @@
+import os
+import unittest
+
+import numpy as np
+
+from data_loader import load_kurs_csv
+from model_pso import PSOOptimizer, SwarmEvaluator
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BUNDLED_CSVS = [os.path.join(BASE_DIR, name) for name in
+                ("Kurs Transaksi USD.csv", "Kurs Transaksi GBP.csv", "Kurs Transaksi JPY .csv")]
+PSO_PARAMS = dict(n_particles=8, n_iterations=4, w=0.7, c1=1.5, c2=1.5, n_intervals=7)
+
+
+def make_particles(optimizer, data_series, n_random=20):
+    # Partikel acak ditambah partikel yang batasnya tepat di titik data (termasuk nilai kembar)
+    rng = np.random.RandomState(0)
+    particles = [optimizer.initialize_particles() for _ in range(n_random // optimizer.n_particles + 1)]
+    particles = np.concatenate(particles)[:n_random]
+    on_data = np.sort(rng.choice(data_series, (5, optimizer.n_intervals - 1)), axis=1)
+    z = rng.uniform(*optimizer.z1_range, (5, 2))
+    return np.vstack((particles, np.column_stack((z, on_data))))
+
+
+class SwarmEvaluatorTest(unittest.TestCase):
+    def setUp(self):
+        self.datasets = {os.path.basename(path): load_kurs_csv(path)[0] for path in BUNDLED_CSVS}
+
+    def test_evaluate_matches_evaluate_particle(self):
+        for name, data in self.datasets.items():
+            with self.subTest(csv=name):
+                optimizer = PSOOptimizer(data, seed=3, **PSO_PARAMS)
+                evaluator = SwarmEvaluator(optimizer.data_series)
+                particles = make_particles(optimizer, optimizer.data_series)
+                expected = np.array([optimizer.evaluate_particle(particle) for particle in particles])
+
+                np.testing.assert_allclose(evaluator.evaluate(particles), expected, rtol=1e-12)
+
+                positions = evaluator.boundary_positions(particles)
+                counts = evaluator.scan_transition_counts(particles)
+                np.testing.assert_allclose(evaluator.mape_from_counts(particles, positions, counts), expected,
+                                           rtol=1e-12)
+
+    def test_executors_agree(self):
+        data = self.datasets["Kurs Transaksi USD.csv"]
+        # cache_size=0: seluruh evaluasi dikirim ke executor, bukan hanya matriks FLRG yang belum ada di cache
+        for cache_size in (4096, 0):
+            scores = {}
+            for executor in ("serial", "thread", "process"):
+                optimizer = PSOOptimizer(data, seed=11, executor=executor, n_workers=2, cache_size=cache_size,
+                                         **PSO_PARAMS)
+                scores[executor] = optimizer.gbest_score
+            with self.subTest(cache_size=cache_size):
+                self.assertEqual(scores["thread"], scores["serial"])
+                self.assertEqual(scores["process"], scores["serial"])
+
+
+if __name__ == "__main__":
+    unittest.main()
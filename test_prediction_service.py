@@ -0,0 +1,129 @@
+import http.client
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from fts_model import FTSLeeModel
+from prediction_service import ModelRegistry, PredictionService
+
+BUNDLED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Kurs Transaksi USD.csv")
+
+
+def make_model():
+    intervals = np.array([15000.0, 15500.0, 16000.0, 16500.0])
+    fuzzy_classes = (intervals[:-1] + intervals[1:]) / 2
+    counts = np.array([[2, 1, 0], [1, 3, 1], [0, 2, 2]])
+    return FTSLeeModel(intervals, fuzzy_classes, counts, last_state=1, n_data=13, mape=1.0)
+
+
+class PredictionServiceTest(unittest.TestCase):
+    # Server sungguhan pada port acak di 127.0.0.1; tidak butuh jaringan luar
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.model_dir = os.path.join(self.tmp, "models")
+        self.data_dir = os.path.join(self.tmp, "data")
+        os.makedirs(self.model_dir)
+        os.makedirs(self.data_dir)
+        shutil.copy(BUNDLED_CSV, os.path.join(self.data_dir, "usd.csv"))
+
+        self.model = make_model()
+        self.service = PredictionService(ModelRegistry({"USD": self.model}), model_dir=self.model_dir,
+                                         data_dir=self.data_dir)
+        self.server = self.service.create_server("127.0.0.1", 0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.conn = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+
+    def tearDown(self):
+        self.conn.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.shutdown()
+        shutil.rmtree(self.tmp)
+
+    def request(self, method, path, body=None):
+        payload = body if isinstance(body, (str, bytes)) or body is None else json.dumps(body)
+        self.conn.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+        response = self.conn.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_health(self):
+        status, body = self.request("GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(body["currencies"], ["USD"])
+
+    def test_predict_matches_model(self):
+        rates = [15100.0, 15750.5, 16400.0]
+        status, body = self.request("POST", "/predict", {"currency": "USD", "rates": rates})
+        self.assertEqual(status, 200)
+        np.testing.assert_allclose(body["predictions"], self.model.predict(np.array(rates)))
+
+        status, body = self.request("GET", "/predict?currency=USD&rate=15100&rate=16400")
+        self.assertEqual(status, 200)
+        np.testing.assert_allclose(body["predictions"], self.model.predict(np.array([15100.0, 16400.0])))
+
+    def test_predict_unknown_currency(self):
+        status, _ = self.request("POST", "/predict", {"currency": "EUR", "rates": [1.0]})
+        self.assertEqual(status, 404)
+
+    def test_predict_rejects_invalid_rates(self):
+        cases = [
+            ("GET", "/predict?currency=USD&rate=abc", None),
+            ("GET", "/predict?currency=USD&rate=nan", None),
+            ("GET", "/predict?currency=USD", None),
+            ("POST", "/predict", [1, 2]),
+            ("POST", "/predict", {"currency": "USD", "rates": [None]}),
+            ("POST", "/predict", '{"currency": "USD", "rates": [NaN]}'),
+            ("POST", "/predict", '{"currency": "USD", "rates": [Infinity]}'),
+            ("POST", "/predict", {"currency": "USD", "rates": [True]}),
+            ("POST", "/predict", {"currency": "USD", "rates": "15000"}),
+            ("POST", "/predict", "bukan json"),
+        ]
+        for method, path, body in cases:
+            with self.subTest(path=path, body=body):
+                status, response = self.request(method, path, body)
+                self.assertEqual(status, 400)
+                self.assertIn("error", response)
+        # Koneksi keep-alive tetap bisa dipakai setelah request yang ditolak
+        status, _ = self.request("GET", "/health")
+        self.assertEqual(status, 200)
+
+    def test_refit_rejects_unsafe_paths(self):
+        cases = [
+            {"currency": "../escaped", "csv": "usd.csv"},
+            {"currency": "US D", "csv": "usd.csv"},
+            {"currency": "USD", "csv": "../models/../../etc/passwd"},
+            {"currency": "USD", "csv": BUNDLED_CSV},
+            {"currency": "USD", "csv": "tidak_ada.csv"},
+            {"currency": "USD"},
+        ]
+        for body in cases:
+            with self.subTest(body=body):
+                status, _ = self.request("POST", "/refit", body)
+                self.assertEqual(status, 400)
+        self.assertEqual(os.listdir(self.model_dir), [])
+        self.assertEqual(self.service.registry.currencies(), ["USD"])
+
+    def test_refit_replaces_model(self):
+        params = {"n_particles": 5, "n_iterations": 2, "seed": 1}
+        status, body = self.request("POST", "/refit", {"currency": "USD", "csv": "usd.csv", "params": params})
+        self.assertEqual(status, 202)
+
+        deadline = time.time() + 60
+        while True:
+            status, job = self.request("GET", f"/jobs/{body['job']}")
+            if job["status"] != "running" or time.time() > deadline:
+                break
+            time.sleep(0.1)
+        self.assertEqual(job["status"], "done")
+        self.assertIsNot(self.service.registry.get("USD"), self.model)
+        self.assertEqual(os.listdir(self.model_dir), ["USD.ftsl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
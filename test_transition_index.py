@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from model_pso import SwarmEvaluator
+from transition_index import TransitionIndex
+
+
+class TransitionIndexTest(unittest.TestCase):
+    def setUp(self):
+        # Deret panjang dengan banyak nilai kembar (kurs dibulatkan ke rupiah) agar transition_counts memakai indeks
+        rng = np.random.RandomState(7)
+        self.data_series = np.round(15000 + np.cumsum(rng.normal(0, 3, 20000)))
+        self.evaluator = SwarmEvaluator(self.data_series)
+
+    def make_particles(self, n_intervals):
+        rng = np.random.RandomState(n_intervals)
+        random_bounds = np.sort(rng.uniform(self.evaluator.Dmin, self.evaluator.Dmax, (10, n_intervals - 1)), axis=1)
+        # Batas tepat di titik data, termasuk nilai yang muncul berkali-kali, Dmin dan Dmax
+        values, counts = np.unique(self.data_series, return_counts=True)
+        tied = values[counts > 1]
+        data_bounds = np.sort(rng.choice(tied, (10, n_intervals - 1)), axis=1)
+        edge_bounds = np.tile(np.linspace(self.evaluator.Dmin, self.evaluator.Dmax, n_intervals - 1), (2, 1))
+        bounds = np.vstack((random_bounds, data_bounds, edge_bounds))
+        z = rng.uniform(0, 50, (len(bounds), 2))
+        return np.column_stack((z, bounds))
+
+    def test_index_matches_scan(self):
+        for n_intervals in (2, 5, 9):
+            with self.subTest(n_intervals=n_intervals):
+                particles = self.make_particles(n_intervals)
+                self.assertTrue(self.evaluator.uses_index(particles.shape[1]))
+                np.testing.assert_array_equal(self.evaluator.transition_counts(particles),
+                                              self.evaluator.scan_transition_counts(particles))
+
+    def test_count_matrix_on_rank_positions(self):
+        # Satu batas di posisi data terurut: matriks 2 x 2 harus sama dengan hitungan langsung atas rank
+        index = TransitionIndex.build(self.evaluator.rank)
+        positions = np.arange(0, self.evaluator.n + 1, 997)[:, None]
+        counts = index.count_matrix(positions)
+        below = self.evaluator.rank < positions
+        for row, split in enumerate(below):
+            expected = np.zeros((2, 2), dtype=np.int32)
+            np.add.at(expected, (np.where(split[:-1], 0, 1), np.where(split[1:], 0, 1)), 1)
+            np.testing.assert_array_equal(counts[row], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+class TransitionIndex:
+    # Merge-sort tree atas pasangan (rank a_t, rank a_t+1). Jumlah transisi antar dua rentang
+    # rank dihitung dalam O(log^2 n), jadi matriks FLRG k x k tidak perlu memindai seluruh data.
+    def __init__(self, xs, levels, n):
+        self.xs = xs          # rank a_t, terurut
+        self.levels = levels  # levels[l] = blok berukuran 2^l dengan kunci blok * n + rank a_t+1, terurut
+        self.n = n
+
+    @classmethod
+    def build(cls, rank):
+        n = len(rank)
+        x, y = rank[:-1], rank[1:]
+        order = np.argsort(x, kind="stable")
+        xs, ys = x[order], y[order].astype(np.int64)
+
+        m = len(xs)
+        positions = np.arange(m, dtype=np.int64)
+        n_levels = max(int(m).bit_length(), 1)
+        levels = np.empty((n_levels, m), dtype=np.int64)
+        for level in range(n_levels):
+            levels[level] = np.sort((positions >> level) * n + ys)
+        return cls(xs, levels, n)
+
+    def count_below(self, prefix, y_limit):
+        # Jumlah pasangan pada posisi x-terurut < prefix dengan rank a_t+1 < y_limit
+        prefix = np.asarray(prefix, dtype=np.int64)
+        y_limit = np.asarray(y_limit, dtype=np.int64)
+        total = np.zeros(np.broadcast(prefix, y_limit).shape, dtype=np.int64)
+        for level, keys in enumerate(self.levels):
+            block = (prefix >> (level + 1)) << 1
+            start = block << level
+            found = np.searchsorted(keys, block * self.n + y_limit, side="left") - start
+            total += np.where((prefix >> level) & 1, found, 0)
+        return total
+
+    def count_matrix(self, positions):
+        # positions: batas interior (n_rows x k-1) dalam rank data terurut, seperti boundary_positions
+        n_rows = len(positions)
+        bounds = np.column_stack((
+            np.zeros(n_rows, dtype=np.int64),
+            positions,
+            np.full(n_rows, self.n, dtype=np.int64),
+        ))
+        prefix = np.searchsorted(self.xs, bounds, side="left")
+        grid = self.count_below(prefix[:, :, None], bounds[:, None, :])
+        return (grid[:, 1:, 1:] - grid[:, :-1, 1:] - grid[:, 1:, :-1] + grid[:, :-1, :-1]).astype(np.int32)